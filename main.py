@@ -1,10 +1,23 @@
 """
 Main entry point for the video editing pipeline.
-Provides an interactive menu for running pipeline steps.
+Provides an interactive menu for running pipeline steps, or runs them
+non-interactively when --steps/--input are given on the command line.
+--render renders the final video for several projects in parallel.
 """
 
+import argparse
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from graphlib import TopologicalSorter
+from typing import Any, Callable, Final, Iterable, Sequence
+
+from src.constants import MAX_PARALLEL_STEPS
 from src.services.local_saver import LocalSaverService
-from src.util import extract_filename_without_extension, get_input_video_path
+from src.util import (
+    extract_filename_without_extension,
+    find_input_video,
+    get_input_video_path,
+    scan_project_folders,
+)
 from src.pipeline import (
     rotate_video,
     downsample_video,
@@ -20,69 +33,233 @@ from src.pipeline import (
     create_full_res_cut_video,
     create_full_res_video_with_images,
     create_full_res_video_single_pass,
+    run_batch,
+    clear_llm_editing_cache,
 )
 
+# Step number -> (display name, step function called as fn(base_name, saver))
+STEP_TABLE: dict[int, tuple[str, Callable[[str, LocalSaverService], Any]]] = {
+    0: ("Rotate video if needed", rotate_video),
+    1: ("Downsample video", downsample_video),
+    2: ("Extract audio", extract_audio),
+    3: ("Get transcription", get_transcription),
+    4: ("Prompt LLM", prompt_llm_for_editing),
+    5: ("Generate adjusted sentences", generate_adjusted_sentences),
+    6: ("Create edited video", create_edited_video),
+    7: (
+        "Two-stage feedback loop - Sentence selection & timestamp adjustment",
+        feedback_loop_for_cut,
+    ),
+    8: (
+        "Parse Google Doc script (extract text & images)",
+        parse_google_doc_script,
+    ),
+    9: (
+        "Place Google Doc images (LLM-based placement)",
+        place_google_doc_images,
+    ),
+    10: (
+        "Create video with Google Doc images (downsampled)",
+        create_video_with_google_doc_images,
+    ),
+    11: (
+        "Cut full resolution video + add images (single pass)",
+        create_full_res_video_single_pass,
+    ),
+    12: (
+        "Cut full resolution video only (no images)",
+        create_full_res_cut_video,
+    ),
+    13: (
+        "Add images to full resolution video (uses step 12's cut if present)",
+        create_full_res_video_with_images,
+    ),
+}
+
+# Every step number accepted by the menu and --steps
+VALID_STEPS: Final[frozenset[int]] = frozenset(STEP_TABLE)
+
+# Steps run by the "99" menu option (single-pass full resolution render)
+ALL_STEPS: Final[tuple[int, ...]] = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11)
+
+# Direct data dependencies between steps (step -> steps whose outputs it reads).
+# Steps 1 and 2 stay separate ffmpeg runs rather than one fused two-output pass:
+# audio extraction only demuxes (no video decode), and keeping it independent
+# lets step 3's transcription start without waiting for the proxy encode.
+# Step 9's LLM call reads the sentences produced from step 4's decisions, so the two
+# LLM steps can be neither merged into one prompt nor run concurrently.
+STEP_DEPENDENCIES: dict[int, set[int]] = {
+    0: set(),
+    1: {0},
+    2: {0},
+    3: {2},
+    4: {3},
+    5: {1, 2, 3, 4},
+    6: {1, 5},
+    7: {3, 6},
+    8: set(),  # Only reads the Google Doc export
+    9: {5, 7, 8},
+    10: {6, 7, 9},
+    11: {0, 5, 7, 9},
+    12: {0, 5, 7},
+    # Renders from the original if step 12's cut isn't ready. Steps 11 and 13
+    # write the same file, so 13 waits for 11 when both are selected.
+    13: {0, 5, 7, 9, 11},
+}
+
+# Steps that prompt the user; they run alone so no other output interleaves
+INTERACTIVE_STEPS: Final[frozenset[int]] = frozenset({7})
+
+BANNER: Final[str] = "=" * 50
+DIVIDER: Final[str] = "-" * 50
+
+# Menu text is built once and written with a single print call
+MENU_TEXT: Final[str] = f"""
+{BANNER}
+VIDEO EDITING PIPELINE
+{BANNER}
+
+Available steps:
+  0. Rotate video if needed (check rotation metadata)
+  1. Downsample video
+  2. Extract audio
+  3. Get transcription
+  4. Prompt LLM for editing
+  5. Generate adjusted sentences (silence removal)
+  6. Create edited video (downsampled)
+  7. Two-stage feedback loop - Review sentence selection & adjust timestamps
+  8. Parse Google Doc script (extract text & images)
+  9. Place Google Doc images (LLM-based placement)
+ 10. Create video with Google Doc images (downsampled)
+ 11. Cut full resolution video + add images (single pass)
+
+ Advanced (deprecated two-step approach, transcodes twice):
+ 12. Cut full resolution video only (no images)
+ 13. Add images to full resolution video (uses step 12's cut if present)
+
+ 99. Run all steps (0-11, using single-pass approach)
+
+Enter step numbers separated by commas (e.g., 0,1,2,3)
+or enter 99 to run all steps."""
+
+
+def resolve_step_dependencies(steps: tuple[int, ...]) -> dict[int, set[int]]:
+    """
+    Restrict the step dependency graph to the selected steps.
+
+    Dependencies on steps that were not selected are followed transitively, so
+    ordering between selected steps is preserved even when intermediate steps
+    are skipped (their outputs are assumed to already exist on disk).
+
+    Args:
+        steps: Selected step numbers
+
+    Returns:
+        Mapping of each selected step to the selected steps it must wait for
+    """
+    selected = set(steps)
+    resolved: dict[int, set[int]] = {}
+
+    for step in selected:
+        waits_for: set[int] = set()
+        pending = list(STEP_DEPENDENCIES[step])
+        visited: set[int] = set()
+        while pending:
+            dep = pending.pop()
+            if dep in visited:
+                continue
+            visited.add(dep)
+            if dep in selected:
+                waits_for.add(dep)
+            else:
+                pending.extend(STEP_DEPENDENCIES[dep])
+        resolved[step] = waits_for
+
+    return resolved
 
-def display_menu() -> list[int]:
+
+def parse_step_selection(choice: str) -> tuple[int, ...]:
+    """
+    Parse a step selection such as "0,1,2,3", "99" or "all".
+
+    Args:
+        choice: Comma-separated step numbers, or 99/all for every step
+
+    Returns:
+        Selected step numbers, sorted and unique
+
+    Raises:
+        ValueError: If the selection contains invalid or unknown step numbers
+    """
+    choice = choice.strip()
+    if choice.lower() in ("99", "all"):
+        return ALL_STEPS
+
+    try:
+        steps = {int(s.strip()) for s in choice.split(",")}
+    except ValueError:
+        raise ValueError(
+            "Invalid input. Please enter numbers separated by commas"
+        ) from None
+
+    if not steps <= VALID_STEPS:
+        raise ValueError("Please enter valid step numbers (0-13)")
+    return tuple(sorted(steps))
+
+
+def display_menu() -> tuple[int, ...]:
     """
     Display menu and get user's step selections.
 
     Returns:
-        List of selected step numbers
-    """
-    print("\n" + "=" * 50)
-    print("VIDEO EDITING PIPELINE")
-    print("=" * 50)
-    print("\nAvailable steps:")
-    print("  0. Rotate video if needed (check rotation metadata)")
-    print("  1. Downsample video")
-    print("  2. Extract audio")
-    print("  3. Get transcription")
-    print("  4. Prompt LLM for editing")
-    print("  5. Generate adjusted sentences (silence removal)")
-    print("  6. Create edited video (downsampled)")
-    print(
-        "  7. Two-stage feedback loop - Review sentence selection & adjust timestamps"
-    )
-    print("  8. Parse Google Doc script (extract text & images)")
-    print("  9. Place Google Doc images (LLM-based placement)")
-    print(" 10. Create video with Google Doc images (downsampled)")
-    print(" 11. Cut full resolution video + add images (single pass)")
-    print("\n Advanced (two-step approach):")
-    print(" 12. Cut full resolution video only (no images)")
-    print(" 13. Add images to full resolution video (requires step 12)")
-    print("\n 99. Run all steps (0-11, using single-pass approach)")
-    print("\nEnter step numbers separated by commas (e.g., 0,1,2,3)")
-    print("or enter 99 to run all steps.")
+        Selected step numbers, sorted and unique
+    """
+    print(MENU_TEXT)
 
     while True:
-        choice = input("\nYour selection: ").strip()
-
-        if choice == "99":
-            return [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
+        choice = input("\nYour selection: ")
 
         try:
-            steps = [int(s.strip()) for s in choice.split(",")]
-            valid_steps = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13]
-            if all(step in valid_steps for step in steps):
-                return sorted(set(steps))
-            else:
-                print("Error: Please enter valid step numbers (0-13)")
-        except ValueError:
-            print("Error: Invalid input. Please enter numbers separated by commas")
+            return parse_step_selection(choice)
+        except ValueError as e:
+            print(f"Error: {e}")
+
+
+def resolve_input_filename(
+    filename: str, project_folders: dict[str, str]
+) -> str | None:
+    """
+    Resolve a user-supplied filename to its project folder name.
+
+    Args:
+        filename: Video filename, with or without extension
+        project_folders: Lowercase folder name -> folder name (from scan)
+
+    Returns:
+        Project folder name, or None if no input video exists for it
+    """
+    base_name = extract_filename_without_extension(filename)
+    folder_name = project_folders.get(base_name.lower())
+    if folder_name is None or find_input_video(folder_name) is None:
+        return None
+    return folder_name
 
 
-def get_input_filename() -> str:
+def get_input_filename(saver: LocalSaverService) -> str:
     """
     Get and validate input filename from user.
 
+    Args:
+        saver: Local saver service used to remember the last filename
+
     Returns:
         Base filename without extension
     """
-    print("\n" + "-" * 50)
+    print(f"\n{DIVIDER}")
 
-    saver = LocalSaverService()
     last_filename = saver.get_last_filename()
+    # Scan assets/ once up front; names are matched case-insensitively
+    project_folders = scan_project_folders()
 
     while True:
         if last_filename:
@@ -100,98 +277,216 @@ def get_input_filename() -> str:
                 print("Error: Filename cannot be empty")
                 continue
 
-        base_name = extract_filename_without_extension(filename)
-        input_path = get_input_video_path(base_name)
+        folder_name = resolve_input_filename(filename, project_folders)
 
-        if input_path.exists():
-            print(f"✓ Found: {input_path.name}")
-            saver.save_last_filename(base_name)
-            return base_name
+        if folder_name is not None:
+            print(f"✓ Found: {find_input_video(folder_name).name}")
+            saver.save_last_filename(folder_name)
+            return folder_name
         else:
+            base_name = extract_filename_without_extension(filename)
             print("Error: Video file not found in assets/")
-            print(f"Expected path: {input_path}")
+            print(f"Expected path: {get_input_video_path(base_name)}")
             retry = input("Try again? (y/n): ").strip().lower()
             if retry != "y":
                 raise FileNotFoundError(f"Video file not found: {filename}")
+            # Pick up files added while the prompt was waiting
+            project_folders = scan_project_folders()
+
+
+def _steps_to_start(ready: list[int], running: Iterable[int]) -> list[int]:
+    """
+    Pick which ready steps may start now.
+
+    An interactive step only starts once nothing else is running, and nothing
+    starts while one is running. While an interactive step is waiting, no new
+    steps are started so that it is not starved.
+
+    Args:
+        ready: Steps whose dependencies have finished, in step order
+        running: Steps currently running
+
+    Returns:
+        Steps to submit now
+    """
+    running = set(running)
+    if running & INTERACTIVE_STEPS:
+        return []
+
+    interactive = [step for step in ready if step in INTERACTIVE_STEPS]
+    if interactive:
+        return [] if running else interactive[:1]
+    return list(ready)
 
 
-def run_pipeline(base_name: str, steps: list[int]) -> None:
+def run_pipeline(
+    base_name: str, steps: tuple[int, ...], saver: LocalSaverService
+) -> None:
     """
     Run selected pipeline steps.
 
+    Steps whose dependencies are satisfied run concurrently (bounded by
+    MAX_PARALLEL_STEPS), except interactive steps, which wait for running steps
+    to finish and then run alone on the main thread, so their input() prompts
+    and Ctrl-C behave as in a plain sequential run. On the first failure no new steps are
+    started; steps already running are allowed to finish before the error is
+    re-raised.
+
     Args:
         base_name: Base filename without extension
-        steps: List of step numbers to run
-    """
-    print("\n" + "=" * 50)
-    print(f"RUNNING PIPELINE: {base_name}")
-    print("=" * 50)
-
-    saver = LocalSaverService()
-
-    step_functions = {
-        0: ("Rotate video if needed", lambda: rotate_video(base_name, saver)),
-        1: ("Downsample video", lambda: downsample_video(base_name, saver)),
-        2: ("Extract audio", lambda: extract_audio(base_name, saver)),
-        3: ("Get transcription", lambda: get_transcription(base_name, saver)),
-        4: ("Prompt LLM", lambda: prompt_llm_for_editing(base_name, saver)),
-        5: (
-            "Generate adjusted sentences",
-            lambda: generate_adjusted_sentences(base_name, saver),
-        ),
-        6: ("Create edited video", lambda: create_edited_video(base_name, saver)),
-        7: (
-            "Two-stage feedback loop - Sentence selection & timestamp adjustment",
-            lambda: feedback_loop_for_cut(base_name, saver),
-        ),
-        8: (
-            "Parse Google Doc script (extract text & images)",
-            lambda: parse_google_doc_script(base_name, saver),
-        ),
-        9: (
-            "Place Google Doc images (LLM-based placement)",
-            lambda: place_google_doc_images(base_name, saver),
-        ),
-        10: (
-            "Create video with Google Doc images (downsampled)",
-            lambda: create_video_with_google_doc_images(base_name, saver, force=False),
-        ),
-        11: (
-            "Cut full resolution video + add images (single pass)",
-            lambda: create_full_res_video_single_pass(base_name, saver, force=False),
-        ),
-        12: (
-            "Cut full resolution video only (no images)",
-            lambda: create_full_res_cut_video(base_name, saver, force=False),
-        ),
-        13: (
-            "Add images to full resolution video (requires step 12)",
-            lambda: create_full_res_video_with_images(base_name, saver, force=False),
-        ),
-    }
-
-    for step_num in steps:
-        step_name, step_func = step_functions[step_num]
-        print(f"\n--- Step {step_num}: {step_name} ---")
+        steps: Step numbers to run
+        saver: Local saver service shared by all steps
+    """
+    print(f"\n{BANNER}\nRUNNING PIPELINE: {base_name}\n{BANNER}")
+
+    # Submit every step whose dependencies have finished, and release
+    # dependents as each running step completes.
+    sorter = TopologicalSorter(resolve_step_dependencies(steps))
+    sorter.prepare()
+    ready: list[int] = []
+    running: dict[Future, int] = {}
+    failure: BaseException | None = None
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_STEPS) as executor:
+        while sorter.is_active():
+            if failure is None:
+                ready.extend(sorter.get_ready())
+                ready.sort()
+                to_start = _steps_to_start(ready, running.values())
+                if to_start and to_start[0] in INTERACTIVE_STEPS:
+                    # Nothing else is running here (see _steps_to_start)
+                    step_num = to_start[0]
+                    ready.remove(step_num)
+                    step_name, step_func = STEP_TABLE[step_num]
+                    print(f"\n--- Step {step_num}: {step_name} ---")
+                    try:
+                        step_func(base_name, saver)
+                    except Exception as error:
+                        print(f"\n✗ Error in step {step_num}: {str(error)}")
+                        failure = error
+                    else:
+                        sorter.done(step_num)
+                    continue
+
+                for step_num in to_start:
+                    ready.remove(step_num)
+                    step_name, step_func = STEP_TABLE[step_num]
+                    print(f"\n--- Step {step_num}: {step_name} ---")
+                    running[executor.submit(step_func, base_name, saver)] = step_num
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step_num = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    print(f"\n✗ Error in step {step_num}: {str(error)}")
+                    if failure is None:
+                        failure = error
+                    continue
+                sorter.done(step_num)
+
+    if failure is not None:
+        print("Pipeline stopped due to error.")
+        raise failure
+
+    print(f"\n{BANNER}\n✓ PIPELINE COMPLETE\n{BANNER}")
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
 
+    --steps and --input are optional; whichever is omitted is asked for
+    interactively. --render runs the batch render instead of the pipeline.
+    --refresh-llm discards cached step 4 editing decisions first.
+
+    Args:
+        argv: Arguments to parse. Defaults to sys.argv[1:].
+
+    Returns:
+        Namespace with steps (tuple of step numbers or None), input, render
+        and refresh_llm
+    """
+    parser = argparse.ArgumentParser(description="AI video editing pipeline")
+    parser.add_argument(
+        "--steps",
+        help='Steps to run, e.g. "0,1,2,3", or "all" for steps 0-11',
+    )
+    parser.add_argument(
+        "--input",
+        help="Input video filename or project name (e.g. IMG_0901.MOV)",
+    )
+    parser.add_argument(
+        "--render",
+        nargs="+",
+        metavar="INPUT",
+        help="Run step 11 (full resolution render) for several projects in parallel",
+    )
+    parser.add_argument(
+        "--refresh-llm",
+        action="store_true",
+        help="Clear cached step 4 editing decisions so the LLM is asked again",
+    )
+    args = parser.parse_args(argv)
+
+    if args.steps is not None:
         try:
-            step_func()
-        except Exception as e:
-            print(f"\n✗ Error in step {step_num}: {str(e)}")
-            print("Pipeline stopped due to error.")
-            raise
+            args.steps = parse_step_selection(args.steps)
+        except ValueError as e:
+            parser.error(f"--steps: {e}")
+
+    return args
+
 
-    print("\n" + "=" * 50)
-    print("✓ PIPELINE COMPLETE")
-    print("=" * 50)
+def run_batch_render(filenames: list[str]) -> None:
+    """
+    Render the final full resolution video for several projects in parallel.
+
+    Args:
+        filenames: Input video filenames or project names
+
+    Raises:
+        FileNotFoundError: If any input video doesn't exist
+    """
+    project_folders = scan_project_folders()
+    base_names = []
+    for filename in filenames:
+        base_name = resolve_input_filename(filename, project_folders)
+        if base_name is None:
+            raise FileNotFoundError(f"Video file not found: {filename}")
+        base_names.append(base_name)
+
+    print(f"\n{BANNER}\nBATCH RENDER: {', '.join(base_names)}\n{BANNER}")
+    run_batch(base_names, create_full_res_video_single_pass)
+    print(f"\n{BANNER}\n✓ BATCH RENDER COMPLETE\n{BANNER}")
 
 
 def main() -> None:
     """Main entry point."""
+    args = parse_args()
     try:
-        steps = display_menu()
-        base_name = get_input_filename()
-        run_pipeline(base_name, steps)
+        if args.refresh_llm:
+            clear_llm_editing_cache()
+
+        if args.render is not None:
+            run_batch_render(args.render)
+            return
+
+        saver = LocalSaverService()
+        steps = args.steps if args.steps is not None else display_menu()
+
+        if args.input is not None:
+            base_name = resolve_input_filename(args.input, scan_project_folders())
+            if base_name is None:
+                raise FileNotFoundError(f"Video file not found: {args.input}")
+            saver.save_last_filename(base_name)
+        else:
+            base_name = get_input_filename(saver)
+
+        run_pipeline(base_name, steps, saver)
     except KeyboardInterrupt:
         print("\n\nPipeline cancelled by user.")
     except Exception as e:
@@ -3,22 +3,35 @@ Static configuration constants for the video editing pipeline.
 No logic allowed - only configuration values.
 """
 
-from enum import Enum
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Final
 
 # Base paths - source of truth for all paths in the system
 PROJECT_ROOT = Path(__file__).parent.parent
 ASSETS_DIR = PROJECT_ROOT / "assets"
 ENV_FILE = PROJECT_ROOT / ".env"
-
-# Load environment variables from .env file
-# Try the project .env file first, then fall back to current working directory
-load_dotenv(dotenv_path=ENV_FILE, verbose=False)
-load_dotenv(verbose=False)  # Also check CWD
+CACHE_DIR = ASSETS_DIR / ".cache"  # Content-addressed cache for API results
 
 # Video processing settings
 LOW_RES_HEIGHT = 240  # 240p resolution
+# Input video extensions, in lookup priority (.mp4 first for rotated/processed videos)
+INPUT_VIDEO_EXTENSIONS = (".mp4", ".MP4", ".MOV", ".mov")
+
+# Feedback loop: commands that render a preview of the current sentence selection
+PREVIEW_COMMANDS = ("preview", "show", "render")
+# Feedback that approves the current state outright (compared after normalizing)
+APPROVAL_PHRASES = frozenset(
+    {"approve", "approved", "looks good", "looks great", "perfect", "lgtm", "ok"}
+)
+
+# Debug output
+LOG_COMMANDS = False  # Print the full ffmpeg/melt command line before each render
+
+# Pipeline execution settings
+MAX_PARALLEL_STEPS = 3  # Upper bound on concurrently running pipeline steps
+# Concurrent full resolution renders in a batch (NVENC allows few sessions, and
+# each melt render already spreads its frames over every core)
+MAX_PARALLEL_RENDERS = 2
 
 # Stage-based file names (without prefix)
 # Format: s{stage_number}_{description}
@@ -49,10 +62,22 @@ AUDIO_SAMPLE_RATE = 16000  # 16kHz
 AUDIO_CHANNELS = 1  # Mono
 AUDIO_FORMAT = "wav"
 
+# Speech-to-text settings
+# Audio longer than this is split near silences and transcribed in parallel
+STT_CHUNK_SECONDS = 600
+STT_SPLIT_SEARCH_SECONDS = 5  # Look this far either side of a boundary for a pause
+STT_MAX_CONCURRENT_REQUESTS = 4  # Upper bound on simultaneous STT uploads
+
 # Video settings
 VIDEO_CODEC = "libx264"
 VIDEO_PRESET = "fast"
+# Hardware H.264 encoders tried (in order) for the proxy before VIDEO_CODEC
+PROXY_HW_ENCODERS = ("h264_videotoolbox", "h264_nvenc")
+PROXY_HW_BITRATE = "1M"  # Hardware encoders are rate-controlled by bitrate
 AUDIO_CODEC = "pcm_s16le"
+# Audio-only extraction runs alongside the proxy encode (steps 1 and 2), so it
+# is kept to one thread and leaves the remaining cores to the video encoder
+AUDIO_EXTRACT_THREADS = 1
 
 # Silence detection (future use)
 SILENCE_THRESHOLD_DB = -40
@@ -78,19 +103,19 @@ OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 
 
 # OpenRouter Model Options
-class OpenRouterModel(str, Enum):
-    """Available models for OpenRouter API."""
+class OpenRouterModel:
+    """Available models for OpenRouter API (plain model id strings)."""
 
     # OpenAI Models
-    GPT_51 = "openai/gpt-5.1"
-    GEMINI_25_FLASH = "google/gemini-2.5-flash"
-    CLAUDE_SONNET_45 = "anthropic/claude-sonnet-4.5"
+    GPT_51: Final[str] = "openai/gpt-5.1"
+    GEMINI_25_FLASH: Final[str] = "google/gemini-2.5-flash"
+    CLAUDE_SONNET_45: Final[str] = "anthropic/claude-sonnet-4.5"
 
 
 # OpenRouter Image Generation Model Options
-class OpenRouterImageModel(str, Enum):
-    """Available image generation models for OpenRouter API."""
+class OpenRouterImageModel:
+    """Available image generation models for OpenRouter API (plain id strings)."""
 
-    GEMINI_25_FLASH_IMAGE = "google/gemini-2.5-flash-image"
-    GEMINI_3_PRO_IMAGE_PREVIEW = "google/gemini-3-pro-image-preview"
-    FLUX_2_PRO = "black-forest-labs/flux.2-pro"
+    GEMINI_25_FLASH_IMAGE: Final[str] = "google/gemini-2.5-flash-image"
+    GEMINI_3_PRO_IMAGE_PREVIEW: Final[str] = "google/gemini-3-pro-image-preview"
+    FLUX_2_PRO: Final[str] = "black-forest-labs/flux.2-pro"
@@ -3,18 +3,25 @@ Internal, service-agnostic Pydantic models.
 These are the source of truth for all data representations in the system.
 """
 
-from typing import Optional
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Literal, Optional, Union
 from pydantic import BaseModel, Field
 
 
-class WordTimestamp(BaseModel):
+@dataclass(slots=True, frozen=True)
+class WordTimestamp:
     """
     Represents a single word with timing information.
+
+    A slotted, frozen dataclass rather than a BaseModel: transcripts hold
+    thousands of these, and Pydantic still validates and serializes them
+    when nested inside the models below.
     """
 
-    word: str = Field(..., description="The word text")
-    start: float = Field(..., description="Start time in seconds")
-    end: float = Field(..., description="End time in seconds")
+    word: str  # The word text
+    start: float  # Start time in seconds
+    end: float  # End time in seconds
 
 
 class TranscriptSegment(BaseModel):
@@ -48,15 +55,22 @@ class Transcript(BaseModel):
         None, description="Total audio duration in seconds"
     )
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Drop cached derived values when segments are replaced."""
+        super().__setattr__(name, value)
+        if name == "segments":
+            self.__dict__.pop("full_text", None)
+            self.__dict__.pop("word_count", None)
+
+    @cached_property
     def full_text(self) -> str:
-        """Get the complete transcript text."""
-        return " ".join(segment.text for segment in self.segments)
+        """Get the complete transcript text (computed once)."""
+        return " ".join([segment.text for segment in self.segments])
 
-    @property
+    @cached_property
     def word_count(self) -> int:
-        """Get total word count across all segments."""
-        return sum(len(segment.words) for segment in self.segments)
+        """Get total word count across all segments (computed once)."""
+        return sum([len(segment.words) for segment in self.segments])
 
 
 class LLMTranscriptSentence(BaseModel):
@@ -164,6 +178,46 @@ class AdjustedSentences(BaseModel):
     )
 
 
+class AdjustTimestampParameters(BaseModel):
+    """
+    Parameters of an adjust_timestamp action.
+    """
+
+    sentence_index: str = Field(..., description="Index of the sentence to adjust")
+    field: Literal["adjusted_start", "adjusted_end"] = Field(
+        ..., description="Timestamp to change"
+    )
+    new_value: float = Field(..., description="New timestamp in seconds")
+
+
+class AdjustTimestampAction(BaseModel):
+    """
+    Timestamp agent action that moves one sentence boundary.
+    """
+
+    tool: Literal["adjust_timestamp"]
+    parameters: AdjustTimestampParameters
+
+
+class ApproveAction(BaseModel):
+    """
+    Timestamp agent action that approves the current timestamps.
+    """
+
+    tool: Literal["approve"]
+
+
+class AdjustActions(BaseModel):
+    """
+    LLM response of the timestamp adjustment agent.
+    """
+
+    thoughts: str = Field(..., description="LLM reasoning about the feedback")
+    actions: list[Union[AdjustTimestampAction, ApproveAction]] = Field(
+        ..., description="Actions to apply, in order"
+    )
+
+
 class ImageDescription(BaseModel):
     """
     Description of an image to be generated, with sentence associations.
@@ -3,13 +3,20 @@ Pipeline orchestration functions.
 Each function represents a step in the video editing pipeline.
 """
 
-import subprocess
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Callable
 
 from src.services.video import VideoService, MLTVideoService
+from src.services.stt import CachedSTTService
 from src.services.stt.elevenlabs import ElevenLabsSTTService
-from src.services.llm.openrouter import OpenRouterLLMService
+from src.services.llm.base import EDITING_PROMPT_TEMPLATE
+from src.services.llm.openrouter import OpenRouterLLMService, get_shared_llm_service
 from src.services.local_saver import LocalSaverService
+from src.services.content_cache import ContentCache
 from src.services.agents import (
     SentenceSelectionAgent,
     TimestampAdjustmentAgent,
@@ -17,23 +24,67 @@ from src.services.agents import (
 )
 from src.services.html_parser import GoogleDocHTMLParser
 from src.models import (
+    AdjustedSentences,
     Transcript,
+    EditingDecision,
     GoogleDocScript,
     GoogleDocImagePlacements,
 )
-from src.constants import ASSETS_DIR
+from src.constants import ASSETS_DIR, MAX_PARALLEL_RENDERS, PREVIEW_COMMANDS
 from src.util import (
     get_input_video_path,
     get_audio_path,
+    get_downsampled_video_path,
+    get_transcription_path,
     print_progress,
+    print_progress_lines,
+    print_command,
+    run_streaming_command,
     convert_editing_decision_to_result,
     get_edited_video_path,
+    get_editing_result_path,
+    get_full_res_cut_video_path,
     get_stage_11_with_google_doc_images_path,
     get_google_doc_html_path,
     get_google_doc_images_folder,
 )
 
 
+# Shared service instances. Services are created on first use and reused by
+# every step, so per-instance caches (e.g. RMS envelopes, transcripts) and HTTP
+# sessions carry over between steps and feedback-loop iterations.
+
+
+@lru_cache(maxsize=1)
+def _video_service() -> VideoService:
+    """Shared ffmpeg/librosa video service."""
+    return VideoService(ASSETS_DIR)
+
+
+@lru_cache(maxsize=1)
+def _mlt_service() -> MLTVideoService:
+    """Shared MLT rendering service."""
+    return MLTVideoService()
+
+
+@lru_cache(maxsize=1)
+def _llm_service() -> OpenRouterLLMService:
+    """Shared LLM service for editing decisions."""
+    return get_shared_llm_service()
+
+
+@lru_cache(maxsize=1)
+def _llm_editing_cache() -> ContentCache:
+    """On-disk cache of step 4 editing decisions."""
+    return ContentCache("llm_editing")
+
+
+@lru_cache(maxsize=1)
+def _stt_service() -> CachedSTTService:
+    """Shared STT service, so its in-memory transcript cache outlives a step."""
+    return CachedSTTService(ElevenLabsSTTService)
+
+
 def rotate_video(base_name: str, saver: LocalSaverService, force: bool = False) -> None:
     """
     Step 0: Rotate video if needed (check for rotation metadata and create .mp4).
@@ -49,7 +100,7 @@ def rotate_video(base_name: str, saver: LocalSaverService, force: bool = False)
     """
     print_progress(f"Checking video rotation for: {base_name}")
 
-    mlt_service = MLTVideoService()
+    mlt_service = _mlt_service()
     output_path = mlt_service.rotate_video_if_needed(base_name, force=force)
 
     print_progress(f"Video ready: {output_path.name}")
@@ -63,15 +114,20 @@ def downsample_video(base_name: str, saver: LocalSaverService) -> None:
         base_name: Base filename without extension
         saver: Local saver service for checking existence
     """
-    if saver.downsampled_video_exists(base_name):
+    input_path = get_input_video_path(base_name)
+    output_path = get_downsampled_video_path(base_name)
+
+    if saver.output_is_current(output_path, [input_path]):
         print_progress("Downsampled video already exists, skipping")
         return
+    if output_path.exists():
+        print_progress("Source video changed since the proxy was made, regenerating")
 
     print_progress(f"Downsampling video: {base_name}")
-    input_path = get_input_video_path(base_name)
 
-    video_service = VideoService(ASSETS_DIR)
-    video_service.generate_proxy_video(input_path, force=False)
+    video_service = _video_service()
+    video_service.generate_proxy_video(input_path, force=True)
+    saver.record_output_inputs(output_path, [input_path])
 
     print_progress("Downsampled video created")
 
@@ -84,19 +140,44 @@ def extract_audio(base_name: str, saver: LocalSaverService) -> None:
         base_name: Base filename without extension
         saver: Local saver service for checking existence
     """
-    if saver.audio_exists(base_name):
+    input_path = get_input_video_path(base_name)
+    output_path = get_audio_path(base_name)
+
+    if saver.output_is_current(output_path, [input_path]):
         print_progress("Audio file already exists, skipping")
         return
+    if output_path.exists():
+        print_progress("Source video changed since audio was extracted, re-extracting")
 
     print_progress(f"Extracting audio: {base_name}")
-    input_path = get_input_video_path(base_name)
 
-    video_service = VideoService(ASSETS_DIR)
-    video_service.extract_audio(input_path, force=False)
+    video_service = _video_service()
+    video_service.extract_audio(input_path, force=True)
+    saver.record_output_inputs(output_path, [input_path])
 
     print_progress("Audio extracted")
 
 
+def _warm_silence_analysis_in_background(audio_path: Path) -> None:
+    """
+    Start step 5's audio analysis on a daemon thread without waiting for it.
+
+    A failure is only reported: step 5 runs the analysis itself when the
+    shared video service has no cached result.
+
+    Args:
+        audio_path: Path to the extracted audio file
+    """
+
+    def warm() -> None:
+        try:
+            _video_service().warm_silence_analysis(audio_path)
+        except Exception as e:
+            print_progress(f"Background silence analysis failed: {str(e)}")
+
+    threading.Thread(target=warm, name="silence-analysis", daemon=True).start()
+
+
 def get_transcription(base_name: str, saver: LocalSaverService) -> Transcript:
     """
     Step 3: Get transcription from audio.
@@ -108,36 +189,67 @@ def get_transcription(base_name: str, saver: LocalSaverService) -> Transcript:
     Returns:
         Transcript object
     """
-    if saver.transcription_exists(base_name):
+    audio_path = get_audio_path(base_name)
+    output_path = get_transcription_path(base_name)
+
+    if saver.output_is_current(output_path, [audio_path]):
         print_progress("Transcription already exists, loading from file")
         return saver.load_transcription(base_name)
+    if output_path.exists():
+        print_progress("Audio changed since it was transcribed, transcribing again")
 
     print_progress(f"Transcribing audio: {base_name}")
-    audio_path = get_audio_path(base_name)
 
-    stt_service = ElevenLabsSTTService()
-    transcript = stt_service.transcribe(audio_path)
+    # Decode the audio for step 5's silence analysis while the STT request is
+    # in flight; the shared video service keeps the result for that step
+    _warm_silence_analysis_in_background(audio_path)
+    # Identical audio always yields the same transcript, so reuse a previous result
+    transcript = _stt_service().transcribe(audio_path)
 
     saver.save_transcription(base_name, transcript)
+    saver.record_output_inputs(output_path, [audio_path])
     print_progress("Transcription saved")
 
     return transcript
 
 
-def prompt_llm_for_editing(base_name: str, saver: LocalSaverService) -> None:
+def prompt_llm_for_editing(
+    base_name: str, saver: LocalSaverService, force: bool = False
+) -> None:
     """
     Step 4: Prompt LLM for editing decisions and create editable result.
 
+    Decisions are cached by transcript, model, sampling settings and prompt
+    template, so rerunning this step on an unchanged transcript does not call
+    the LLM again.
+
     Args:
         base_name: Base filename without extension
         saver: Local saver service
+        force: If True, ignore any cached decision and query the LLM again
     """
     print_progress("Loading transcript")
     transcript = saver.load_transcription(base_name)
 
-    print_progress("Sending to LLM for editing analysis")
-    llm = OpenRouterLLMService()
-    decision = llm.get_edits(transcript)
+    llm = _llm_service()
+    cache = _llm_editing_cache()
+    sentences_json = llm.transcript_to_sentences_json(transcript)
+    cache_key = ContentCache.hash_text(
+        llm.model,
+        str(llm.temperature),
+        str(llm.max_tokens),
+        EDITING_PROMPT_TEMPLATE,
+        sentences_json,
+    )
+    cached = None if force else cache.get(cache_key)
+
+    if cached is not None:
+        print_progress("Found cached LLM editing decision, skipping API call")
+        decision = EditingDecision.model_validate_json(cached)
+    else:
+        print_progress("Sending to LLM for editing analysis")
+        decision = llm.get_edits(transcript, sentences_json=sentences_json)
+        cache.put(cache_key, decision.model_dump_json())
 
     print_progress("Saving editing decision (LLM response)")
     decision_path = saver.save_editing_decision(base_name, decision)
@@ -152,6 +264,18 @@ def prompt_llm_for_editing(base_name: str, saver: LocalSaverService) -> None:
     print(f"Editable result saved to: {result_path.name}")
 
 
+def clear_llm_editing_cache() -> None:
+    """
+    Delete all cached step 4 editing decisions.
+
+    Entries are already keyed by the prompt template, so editing the prompt
+    never reuses stale decisions; this only reclaims disk space or forces
+    fresh samples for every transcript.
+    """
+    removed = _llm_editing_cache().clear()
+    print_progress(f"Removed {removed} cached LLM editing decision(s)")
+
+
 def generate_adjusted_sentences(base_name: str, saver: LocalSaverService) -> None:
     """
     Step 5: Generate adjusted sentences with silence removal.
@@ -172,7 +296,7 @@ def generate_adjusted_sentences(base_name: str, saver: LocalSaverService) -> Non
     editing_result = saver.load_editing_result(base_name)
 
     print_progress("Generating adjusted sentences with silence removal")
-    video_service = VideoService(ASSETS_DIR)
+    video_service = _video_service()
     adjusted_sentences = video_service.generate_adjusted_sentences(
         base_name=base_name,
         transcript=transcript,
@@ -196,17 +320,48 @@ def create_edited_video(base_name: str, saver: LocalSaverService) -> None:
     adjusted_sentences = saver.load_adjusted_sentences(base_name)
 
     print_progress("Creating edited video (downsampled)")
-    video_service = VideoService(ASSETS_DIR)
+    video_service = _video_service()
     edited_video_path = video_service.create_edited_video(
         base_name=base_name,
         adjusted_sentences=adjusted_sentences,
         use_downsampled=True,
-        force=True,  # Force regeneration for feedback loop
+        skip_if_current=True,  # Re-render for the feedback loop unless unchanged
     )
 
     print_progress(f"Edited video created: {edited_video_path.name}")
 
 
+def _save_and_render_preview(
+    base_name: str, saver: LocalSaverService, adjusted_sentences: AdjustedSentences
+) -> Path:
+    """
+    Save adjusted sentences and render the downsampled edited video from them.
+
+    The render works from the in-memory sentences, so the save runs on a
+    worker thread while ffmpeg renders instead of before it.
+
+    Args:
+        base_name: Base filename without extension
+        saver: Local saver service
+        adjusted_sentences: Sentences to save and render
+
+    Returns:
+        Path to the rendered video
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        saved = executor.submit(
+            saver.save_adjusted_sentences, base_name, adjusted_sentences
+        )
+        video_path = _video_service().create_edited_video(
+            base_name=base_name,
+            adjusted_sentences=adjusted_sentences,
+            use_downsampled=True,
+            skip_if_current=True,
+        )
+        saved.result()
+    return video_path
+
+
 def feedback_loop_for_cut(base_name: str, saver: LocalSaverService) -> None:
     """
     Step 7: Two-stage interactive feedback loop for refining the cut.
@@ -214,6 +369,9 @@ def feedback_loop_for_cut(base_name: str, saver: LocalSaverService) -> None:
     Stage 1: Sentence Selection - User reviews which sentences to keep/remove (s4)
     Stage 2: Timestamp Adjustment - User reviews and adjusts timestamps (s5)
 
+    In stage 1 the preview video is only re-rendered when the user asks for it
+    (see PREVIEW_COMMANDS); stage 2 always starts from a fresh render.
+
     Args:
         base_name: Base filename without extension
         saver: Local saver service
@@ -227,9 +385,8 @@ def feedback_loop_for_cut(base_name: str, saver: LocalSaverService) -> None:
 
     # Load necessary data
     transcript = saver.load_transcription(base_name)
-    from src.util import get_editing_result_path
-
     editing_result_path = get_editing_result_path(base_name)
+    video_service = _video_service()
 
     # =====================================================================
     # STAGE 1: SENTENCE SELECTION (s4 - editing_result.json)
@@ -242,6 +399,17 @@ def feedback_loop_for_cut(base_name: str, saver: LocalSaverService) -> None:
     sentence_agent = SentenceSelectionAgent()
     stage1_iteration = 1
     max_iterations = 10  # Safety limit
+    # Step 6's video may predate edits to the selection, so compare it with a
+    # render of the current one
+    preview_stale = not video_service.edited_video_is_current(
+        base_name,
+        video_service.generate_adjusted_sentences(
+            base_name=base_name,
+            transcript=transcript,
+            editing_result=saver.load_editing_result(base_name),
+            use_downsampled=True,
+        ),
+    )
 
     while stage1_iteration <= max_iterations:
         print(f"\n--- Stage 1 - Iteration {stage1_iteration} ---")
@@ -251,35 +419,17 @@ def feedback_loop_for_cut(base_name: str, saver: LocalSaverService) -> None:
 
         # Show current sentence status
         print("\n📋 Current sentence selection:")
-        kept_count = sum(
-            1 for sr in editing_result.sentence_results.values() if sr.keep
-        )
-        removed_count = sum(
-            1 for sr in editing_result.sentence_results.values() if not sr.keep
-        )
+        kept_count = sum(sr.keep for sr in editing_result.sentence_results.values())
+        removed_count = len(editing_result.sentence_results) - kept_count
         print(f"   ✓ Kept: {kept_count} sentences")
         print(f"   ✗ Removed: {removed_count} sentences")
 
-        # Regenerate adjusted sentences and video from current editing result
-        print("\n🎬 Generating video with current sentence selection...")
-        video_service = VideoService(ASSETS_DIR)
-        adjusted_sentences = video_service.generate_adjusted_sentences(
-            base_name=base_name,
-            transcript=transcript,
-            editing_result=editing_result,
-            use_downsampled=True,
-        )
-        saver.save_adjusted_sentences(base_name, adjusted_sentences)
-
-        edited_video_path = video_service.create_edited_video(
-            base_name=base_name,
-            adjusted_sentences=adjusted_sentences,
-            use_downsampled=True,
-            force=True,
-        )
-
-        print(f"\n📹 Video location: {edited_video_path}")
-        print("Please review the video to see which sentences are included.")
+        if preview_stale:
+            print("\n📹 The video doesn't include these changes yet.")
+            print("   (Type 'preview' to render it)")
+        else:
+            print(f"\n📹 Video location: {edited_video_path}")
+            print("Please review the video to see which sentences are included.")
 
         # Get user feedback
         print("\n💬 Is the sentence selection good?")
@@ -291,6 +441,21 @@ def feedback_loop_for_cut(base_name: str, saver: LocalSaverService) -> None:
             print("⚠ No feedback provided. Please try again.")
             continue
 
+        if user_feedback.lower() in PREVIEW_COMMANDS:
+            # Regenerate adjusted sentences and video from current editing result
+            print("\n🎬 Generating video with current sentence selection...")
+            adjusted_sentences = video_service.generate_adjusted_sentences(
+                base_name=base_name,
+                transcript=transcript,
+                editing_result=editing_result,
+                use_downsampled=True,
+            )
+            edited_video_path = _save_and_render_preview(
+                base_name, saver, adjusted_sentences
+            )
+            preview_stale = False
+            continue
+
         # Process feedback with sentence selection agent
         try:
             print("\n🤖 Processing feedback with Sentence Selection Agent...")
@@ -310,6 +475,7 @@ def feedback_loop_for_cut(base_name: str, saver: LocalSaverService) -> None:
             # Save updated editing result
             print("\n💾 Saving updated sentence selection...")
             saver.save_editing_result(base_name, updated_editing_result)
+            preview_stale = True
 
             stage1_iteration += 1
 
@@ -335,22 +501,15 @@ def feedback_loop_for_cut(base_name: str, saver: LocalSaverService) -> None:
     # Regenerate adjusted sentences from approved editing result
     print("\n🔄 Regenerating adjusted sentences from approved sentence selection...")
     editing_result = saver.load_editing_result(base_name)
-    video_service = VideoService(ASSETS_DIR)
     adjusted_sentences = video_service.generate_adjusted_sentences(
         base_name=base_name,
         transcript=transcript,
         editing_result=editing_result,
         use_downsampled=True,
     )
-    saver.save_adjusted_sentences(base_name, adjusted_sentences)
 
     # Regenerate video
-    edited_video_path = video_service.create_edited_video(
-        base_name=base_name,
-        adjusted_sentences=adjusted_sentences,
-        use_downsampled=True,
-        force=True,
-    )
+    edited_video_path = _save_and_render_preview(base_name, saver, adjusted_sentences)
 
     print(f"\n📹 Video location: {edited_video_path}")
     print("Please review the video to check timestamps and pacing.")
@@ -390,18 +549,11 @@ def feedback_loop_for_cut(base_name: str, saver: LocalSaverService) -> None:
                 saver.save_adjusted_sentences(base_name, updated_sentences)
                 break
 
-            # Save updated sentences
+            # Save updated sentences and regenerate the video from them
             print("\n💾 Saving updated timestamps...")
-            saver.save_adjusted_sentences(base_name, updated_sentences)
-
-            # Regenerate the video with updated sentences
             print("\n🎬 Regenerating video with timestamp adjustments...")
-            video_service = VideoService(ASSETS_DIR)
-            edited_video_path = video_service.create_edited_video(
-                base_name=base_name,
-                adjusted_sentences=updated_sentences,
-                use_downsampled=True,
-                force=True,
+            edited_video_path = _save_and_render_preview(
+                base_name, saver, updated_sentences
             )
 
             print(f"\n✓ Updated video created: {edited_video_path.name}")
@@ -483,6 +635,23 @@ def parse_google_doc_script(
     print_progress(f"  - Lines with text: {len(script.lines)}")
     print_progress(f"  - Lines with images: {lines_with_images}")
 
+    # Images ship with the HTML export, so resolve them against one listing of
+    # the local images folder instead of fetching or stat-ing each one
+    images_folder = get_google_doc_images_folder(base_name)
+    if lines_with_images and images_folder.is_dir():
+        with os.scandir(images_folder) as entries:
+            available_images = {entry.name for entry in entries if entry.is_file()}
+        missing_images = [
+            line.image_filename
+            for line in script.lines
+            if line.image_filename and line.image_filename not in available_images
+        ]
+        if missing_images:
+            print_progress(
+                f"  ⚠ {len(missing_images)} image(s) not found in "
+                f"{images_folder}: {', '.join(missing_images)}"
+            )
+
     # Print sample of parsed content
     print("\nSample of parsed content:")
     for i, line in enumerate(script.lines[:5], 1):
@@ -495,6 +664,20 @@ def parse_google_doc_script(
     return script
 
 
+# avformat consumer properties for render_shotcut_mlt (everything but the paths)
+SHOTCUT_CONSUMER_ARGS = (
+    "vcodec=libx264",
+    "acodec=aac",
+    "crf=23",
+    "preset=fast",
+    "movflags=+faststart",
+    "real_time=-1",
+    "rescale=bilinear",
+    "deinterlace_method=yadif",
+    "top_field_first=2",
+)
+
+
 def render_shotcut_mlt(force: bool = False) -> Path:
     """
     Render video from Shotcut MLT file (for testing).
@@ -527,25 +710,12 @@ def render_shotcut_mlt(force: bool = False) -> Path:
 
     print_progress(f"Rendering video from: {mlt_path}")
 
-    cmd = [
-        "melt",
-        str(mlt_path),
-        "-consumer",
-        f"avformat:{output_path}",
-        "vcodec=libx264",
-        "acodec=aac",
-        "crf=23",
-        "preset=fast",
-        "movflags=+faststart",
-        "real_time=-1",
-        "rescale=bilinear",
-        "deinterlace_method=yadif",
-        "top_field_first=2",
-    ]
+    cmd = ["melt", str(mlt_path), "-consumer", f"avformat:{output_path}"]
+    cmd.extend(SHOTCUT_CONSUMER_ARGS)
     print_progress("Running melt command...")
-    print_progress(f"Command: {' '.join(cmd)}")
+    print_command(cmd)
 
-    subprocess.run(cmd, capture_output=True, text=True, check=True)
+    run_streaming_command(cmd)
 
     print("\n" + "=" * 60)
     print("Render Complete!")
@@ -576,15 +746,17 @@ def place_google_doc_images(
         print_progress("Google Doc image placements already exist, loading from file")
         placements = saver.load_google_doc_image_placements(base_name)
         print_progress(f"Loaded {len(placements.placements)} image placements")
+        summary = []
         for i, placement in enumerate(placements.placements, 1):
             sentence_range = (
                 f"{placement.sentence_indexes[0]}-{placement.sentence_indexes[-1]}"
                 if len(placement.sentence_indexes) > 1
                 else placement.sentence_indexes[0]
             )
-            print_progress(
+            summary.append(
                 f"  {i}. {Path(placement.filepath).name}: sentences {sentence_range}"
             )
+        print_progress_lines(summary)
         return placements
 
     print_progress(f"Placing Google Doc images for: {base_name}")
@@ -616,6 +788,7 @@ def place_google_doc_images(
 
     # Print summary
     print_progress(f"Successfully placed {len(placements.placements)} images")
+    summary = []
     for i, placement in enumerate(placements.placements, 1):
         sentence_range = (
             f"{placement.sentence_indexes[0]}-{placement.sentence_indexes[-1]}"
@@ -623,9 +796,10 @@ def place_google_doc_images(
             else placement.sentence_indexes[0]
         )
         num_sentences = len(placement.sentence_indexes)
-        print_progress(
+        summary.append(
             f"  {i}. {Path(placement.filepath).name}: sentences {sentence_range} ({num_sentences} sentence{'s' if num_sentences > 1 else ''})"
         )
+    print_progress_lines(summary)
 
     return placements
 
@@ -657,7 +831,7 @@ def create_video_with_google_doc_images(
     image_placements = saver.load_google_doc_image_placements(base_name)
 
     print_progress("Creating video with Google Doc image overlays using MLT")
-    mlt_service = MLTVideoService()
+    mlt_service = _mlt_service()
     video_path = mlt_service.create_video_with_google_doc_images(
         base_name=base_name,
         adjusted_sentences=adjusted_sentences,
@@ -673,7 +847,10 @@ def create_full_res_cut_video(
     base_name: str, saver: LocalSaverService, force: bool = False
 ) -> Path:
     """
-    Step 11: Cut full resolution video using MLT based on adjusted sentences.
+    Step 12: Cut full resolution video using MLT based on adjusted sentences.
+
+    Deprecated as part of the final render (see Step 11); still useful when a
+    cut without images is wanted.
 
     Args:
         base_name: Base filename without extension
@@ -690,7 +867,7 @@ def create_full_res_cut_video(
     adjusted_sentences = saver.load_adjusted_sentences(base_name)
 
     print_progress("Creating full resolution cut video using MLT")
-    mlt_service = MLTVideoService()
+    mlt_service = _mlt_service()
     video_path = mlt_service.create_full_res_cut_video(
         base_name=base_name,
         adjusted_sentences=adjusted_sentences,
@@ -705,7 +882,15 @@ def create_full_res_video_with_images(
     base_name: str, saver: LocalSaverService, force: bool = False
 ) -> Path:
     """
-    Step 12: Create full resolution video with Google Doc image overlays using MLT.
+    Step 13: Create full resolution video with Google Doc image overlays using MLT.
+
+    Deprecated: kept for re-rendering images over an existing step 12 cut.
+    Step 11 produces the same video in one pass and is the default.
+
+    Overlays images onto the full resolution cut when it already exists. If the
+    cut is not available (e.g. it is being rendered concurrently), the cuts and
+    images are rendered from the original in a single pass instead of waiting
+    for the cut and decoding it a second time.
 
     Args:
         base_name: Base filename without extension
@@ -722,16 +907,28 @@ def create_full_res_video_with_images(
     adjusted_sentences = saver.load_adjusted_sentences(base_name)
     image_placements = saver.load_google_doc_image_placements(base_name)
 
-    print_progress(
-        "Creating full resolution video with Google Doc image overlays using MLT"
-    )
-    mlt_service = MLTVideoService()
-    video_path = mlt_service.create_full_res_video_with_images(
-        base_name=base_name,
-        adjusted_sentences=adjusted_sentences,
-        image_placements=image_placements,
-        force=force,
-    )
+    mlt_service = _mlt_service()
+    if get_full_res_cut_video_path(base_name).exists():
+        print_progress(
+            "Creating full resolution video with Google Doc image overlays using MLT"
+        )
+        video_path = mlt_service.create_full_res_video_with_images(
+            base_name=base_name,
+            adjusted_sentences=adjusted_sentences,
+            image_placements=image_placements,
+            force=force,
+        )
+    else:
+        print_progress(
+            "Full resolution cut not available, rendering cuts and images "
+            "from the original in a single pass"
+        )
+        video_path = mlt_service.create_full_res_video_with_images_single_pass(
+            base_name=base_name,
+            adjusted_sentences=adjusted_sentences,
+            image_placements=image_placements,
+            force=force,
+        )
 
     print_progress(
         f"Full resolution video with Google Doc images created: {video_path.name}"
@@ -745,8 +942,10 @@ def create_full_res_video_single_pass(
     """
     Step 11: Create full resolution video with cuts AND images in a single MLT pass.
 
-    This is more efficient than the two-step approach (Steps 11+12) as it does
-    both cutting and image overlay in one rendering operation.
+    This is the default final render. It decodes and encodes the original once,
+    where the two-step approach (Steps 12+13) transcodes the whole video twice.
+    An existing render is reused as long as the original video, adjusted
+    sentences and image placements (including the image files) are unchanged.
 
     Args:
         base_name: Base filename without extension
@@ -764,13 +963,79 @@ def create_full_res_video_single_pass(
     image_placements = saver.load_google_doc_image_placements(base_name)
 
     print_progress("Creating full resolution video with cuts and images (single pass)")
-    mlt_service = MLTVideoService()
+    mlt_service = _mlt_service()
     video_path = mlt_service.create_full_res_video_with_images_single_pass(
         base_name=base_name,
         adjusted_sentences=adjusted_sentences,
         image_placements=image_placements,
         force=force,
+        skip_if_current=True,
     )
 
     print_progress(f"Full resolution video created: {video_path.name}")
     return video_path
+
+
+def _run_step_in_worker(
+    step_fn: Callable[[str, LocalSaverService], Any], base_name: str
+) -> Any:
+    """
+    Run one step for one project inside a batch worker process.
+
+    Args:
+        step_fn: Pipeline step function (must be module-level so it pickles)
+        base_name: Base filename without extension
+
+    Returns:
+        Whatever the step returns
+    """
+    return step_fn(base_name, LocalSaverService())
+
+
+def run_batch(
+    base_names: list[str],
+    step_fn: Callable[[str, LocalSaverService], Any],
+    max_workers: int = MAX_PARALLEL_RENDERS,
+) -> dict[str, Any]:
+    """
+    Run one step for several projects in parallel worker processes.
+
+    Intended for the full resolution renders, where each project is an
+    independent melt run, and for non-interactive LLM steps such as image
+    placement (step 9), which are network-bound and can use a larger
+    max_workers. Every project is attempted even if another fails.
+
+    Args:
+        base_names: Base filenames without extension
+        step_fn: Pipeline step function to run for each project
+        max_workers: Maximum number of projects processed at once
+
+    Returns:
+        Mapping of base name to the step's return value
+
+    Raises:
+        RuntimeError: If the step failed for any project
+    """
+    results: dict[str, Any] = {}
+    failures: dict[str, BaseException] = {}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_run_step_in_worker, step_fn, base_name): base_name
+            for base_name in base_names
+        }
+        for future in as_completed(futures):
+            base_name = futures[future]
+            try:
+                results[base_name] = future.result()
+                print_progress(f"✓ {base_name} done")
+            except Exception as e:
+                print_progress(f"✗ {base_name} failed: {e}")
+                failures[base_name] = e
+
+    if failures:
+        names = ", ".join(sorted(failures))
+        raise RuntimeError(f"Batch step failed for: {names}") from next(
+            iter(failures.values())
+        )
+    return results
@@ -0,0 +1,33 @@
+"""
+Response cache helpers shared by the LLM agents.
+
+Agents cache a response only after everything it asked for has been applied,
+so a response that failed is requested again rather than replayed.
+"""
+
+from src.services.content_cache import ContentCache
+from src.services.llm.base import LLMService
+
+
+def agent_cache_key(
+    llm_service: LLMService, temperature: float, max_tokens: int, *parts: str
+) -> str:
+    """
+    Build the response cache key for an agent prompt.
+
+    Args:
+        llm_service: LLM service the prompt is sent to
+        temperature: Sampling temperature passed with the prompt
+        max_tokens: Token limit passed with the prompt
+        *parts: Prompt templates and the inputs rendered into them
+
+    Returns:
+        Cache key covering the LLM settings and every prompt part
+    """
+    return ContentCache.hash_text(
+        type(llm_service).__name__,
+        str(getattr(llm_service, "model", "")),
+        str(temperature),
+        str(max_tokens),
+        *parts,
+    )
@@ -0,0 +1,39 @@
+"""
+JSON helpers shared by the LLM agents.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # Optional: falls back to the stdlib parser
+    orjson = None
+
+
+def extract_and_parse(response_text: str) -> dict[str, Any]:
+    """
+    Parse the JSON object in an LLM response.
+
+    Everything before the first "{" and after the last "}" is ignored, which
+    drops markdown code fences and any text around the object.
+
+    Args:
+        response_text: Raw response text from LLM
+
+    Returns:
+        Parsed JSON dictionary
+
+    Raises:
+        ValueError: If no JSON object is found or it cannot be parsed
+            (json.JSONDecodeError is a ValueError)
+    """
+    start = response_text.find("{")
+    end = response_text.rfind("}")
+    if start == -1 or end == -1:
+        raise ValueError("No JSON object found in response")
+
+    json_text = response_text[start : end + 1]
+    if orjson is not None:
+        return orjson.loads(json_text)
+    return json.loads(json_text)
@@ -3,9 +3,12 @@ Google Doc Image Placer Agent - Places images from Google Doc script into video
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Optional
 
+from pydantic_core import to_json
+
 from src.models import (
     AdjustedSentences,
     GoogleDocScript,
@@ -13,7 +16,10 @@ from src.models import (
     GoogleDocImagePlacements,
 )
 from src.services.llm.base import LLMService
-from src.services.llm.openrouter import OpenRouterLLMService
+from src.services.llm.openrouter import get_shared_llm_service
+from src.services.content_cache import ContentCache
+from src.services.agents._cache_utils import agent_cache_key
+from src.services.agents._json_utils import extract_and_parse
 
 
 GOOGLE_DOC_IMAGE_PLACER_PROMPT = """You are a video editing assistant helping to place images from a script onto a video timeline.
@@ -22,13 +28,7 @@ You have two pieces of information:
 1. The Google Doc script with text lines and associated images
 2. The actual video sentences with their indexes
 
-Your task is to match the script's image placements to the actual video sentences and determine which sentence indexes each image should appear over.
-
-Google Doc Script (what was planned):
-{google_doc_script_json}
-
-Actual Video Sentences (indexed):
-{adjusted_sentences_json}
+Your task is to match the script's image placements to the actual video sentences and determine which sentence indexes each image should appear over. Both are given in the user message.
 
 Instructions:
 - Match each image from the Google Doc script to the corresponding sentences in the actual video
@@ -40,19 +40,19 @@ Instructions:
 - If an image in the script doesn't match any video content, skip it
 
 Respond with a JSON object in this exact format:
-{{
+{
     "thoughts": "Your analysis of how the script maps to the video and your placement decisions",
     "placements": [
-        {{
+        {
             "filepath": "image1.png",
             "sentence_indexes": ["1", "2"]
-        }},
-        {{
+        },
+        {
             "filepath": "image2.png",
             "sentence_indexes": ["5", "6", "7"]
-        }}
+        }
     ]
-}}
+}
 
 Important:
 - sentence_indexes should be strings (e.g., "1", "2", not 1, 2)
@@ -62,6 +62,13 @@ Important:
 - The filepath should match the image filename from the Google Doc script (e.g., "image1.png", "image2.png")
 """
 
+GOOGLE_DOC_IMAGE_PLACER_INPUTS_TEMPLATE = """Google Doc Script (what was planned):
+{google_doc_script_json}
+
+Actual Video Sentences (indexed):
+{adjusted_sentences_json}
+"""
+
 
 class GoogleDocImagePlacer:
     """
@@ -69,17 +76,23 @@ class GoogleDocImagePlacer:
     Uses an LLM to intelligently match script content to actual video sentences.
     """
 
-    def __init__(self, llm_service: Optional[LLMService] = None):
+    def __init__(
+        self,
+        llm_service: Optional[LLMService] = None,
+        cache: Optional[ContentCache] = None,
+    ):
         """
         Initialize the Google Doc Image Placer.
 
         Args:
-            llm_service: LLM service to use. If None, creates default OpenRouterLLMService.
+            llm_service: LLM service to use. If None, uses the shared OpenRouterLLMService.
+            cache: Cache of LLM responses. Defaults to the "agent_responses" namespace.
         """
-        self.llm_service = llm_service or OpenRouterLLMService(
-            temperature=0.3,  # Lower temperature for more consistent placement decisions
-            max_tokens=4000,
-        )
+        self.llm_service = llm_service or get_shared_llm_service()
+        # Passed per call, so a shared service can serve every agent
+        self.temperature = 0.3  # Lower temperature for more consistent placement decisions
+        self.max_tokens = 4000
+        self.cache = cache or ContentCache("agent_responses")
 
     def place_images(
         self,
@@ -90,6 +103,10 @@ class GoogleDocImagePlacer:
         """
         Place images from Google Doc script onto video timeline by matching to sentence indexes.
 
+        The prompt only contains sentence indexes and text, so a previous LLM
+        response is reused as long as the script and the sentence wording are
+        unchanged (e.g. after timestamp-only edits).
+
         Args:
             google_doc_script: Parsed Google Doc script with text and image associations
             adjusted_sentences: Video sentences with indexes
@@ -105,49 +122,73 @@ class GoogleDocImagePlacer:
         script_json = self._script_to_json(google_doc_script)
         sentences_json = self._sentences_to_json(adjusted_sentences)
 
-        # Build prompt
-        prompt = GOOGLE_DOC_IMAGE_PLACER_PROMPT.format(
+        # Build prompt: static instructions first (cacheable by the provider),
+        # inputs last
+        prompt = GOOGLE_DOC_IMAGE_PLACER_INPUTS_TEMPLATE.format(
             google_doc_script_json=script_json,
             adjusted_sentences_json=sentences_json,
         )
 
-        # Get LLM response
+        # Get LLM response (reused from the cache for identical inputs)
+        cache_key = agent_cache_key(
+            self.llm_service,
+            self.temperature,
+            self.max_tokens,
+            GOOGLE_DOC_IMAGE_PLACER_PROMPT,
+            GOOGLE_DOC_IMAGE_PLACER_INPUTS_TEMPLATE,
+            script_json,
+            sentences_json,
+        )
+        response_text = self.cache.get(cache_key)
+        is_cached = response_text is not None
         try:
-            response_text = self.llm_service.complete(prompt=prompt)
-
-            # Parse JSON response
-            response_text = response_text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            response_text = response_text.strip()
+            if is_cached:
+                print("\n♻️  Reusing cached image placements for identical inputs")
+            else:
+                response_text = self.llm_service.complete(
+                    prompt=prompt,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    system_blocks=[GOOGLE_DOC_IMAGE_PLACER_PROMPT],
+                )
 
-            response_data = json.loads(response_text)
+            # Parse JSON response (ignores markdown fences around the object)
+            response_data = extract_and_parse(response_text)
 
             # Validate response structure
             if "placements" not in response_data:
                 raise ValueError("Response missing 'placements' field")
+            if not is_cached:
+                self.cache.put(cache_key, response_text)
 
             thoughts = response_data.get("thoughts", "")
             print(f"\n🤖 Agent thoughts: {thoughts}\n")
 
+            # List the images folder once rather than stat-ing every placement
+            with os.scandir(google_doc_images_folder) as entries:
+                available_images = {entry.name for entry in entries if entry.is_file()}
+            images_by_lower_name = {name.lower(): name for name in available_images}
+
             # Convert to GoogleDocImagePlacement objects with full paths
             placements = []
             for placement_data in response_data["placements"]:
                 # Get the image filename from the response
                 image_filename = placement_data["filepath"]
 
+                # Verify image exists, tolerating a change of case by the LLM
+                if image_filename not in available_images:
+                    matched = images_by_lower_name.get(image_filename.lower())
+                    if matched is None:
+                        print(
+                            f"   ⚠ Warning: Image not found: "
+                            f"{google_doc_images_folder / image_filename}"
+                        )
+                        continue
+                    image_filename = matched
+
                 # Build full path to the image
                 full_image_path = google_doc_images_folder / image_filename
 
-                # Verify image exists
-                if not full_image_path.exists():
-                    print(f"   ⚠ Warning: Image not found: {full_image_path}")
-                    continue
-
                 # Get sentence indexes (ensure they are strings)
                 sentence_indexes = [
                     str(idx) for idx in placement_data["sentence_indexes"]
@@ -189,14 +230,11 @@ class GoogleDocImagePlacer:
         Returns:
             JSON string representation
         """
-        script_lines = []
-        for line in google_doc_script.lines:
-            line_dict = {
-                "text": line.text,
-                "image_filename": line.image_filename,
-            }
-            script_lines.append(line_dict)
-        return json.dumps(script_lines, indent=2)
+        script_lines = [
+            line.model_dump(include={"text", "image_filename"})
+            for line in google_doc_script.lines
+        ]
+        return to_json(script_lines).decode()
 
     def _sentences_to_json(self, adjusted_sentences: AdjustedSentences) -> str:
         """
@@ -208,7 +246,7 @@ class GoogleDocImagePlacer:
         Returns:
             JSON string representation
         """
-        sentences_dict = {}
-        for sentence in adjusted_sentences.sentences:
-            sentences_dict[sentence.index] = sentence.text
-        return json.dumps(sentences_dict, indent=2)
+        sentences_dict = {
+            sentence.index: sentence.text for sentence in adjusted_sentences.sentences
+        }
+        return to_json(sentences_dict).decode()
@@ -3,20 +3,29 @@ Image Planning Agent - Generates image descriptions and prompts based on video t
 """
 
 import json
+from collections import defaultdict
 from typing import Optional
 
 from src.models import ImageDescription, AdjustedSentences
 from src.services.llm.base import LLMService
-from src.services.llm.openrouter import OpenRouterLLMService
+from src.services.llm.openrouter import get_shared_llm_service
+from src.services.agents._json_utils import extract_and_parse
 
+# Collapse repeated sentence texts in the prompt only when at least this share
+# of sentences are duplicates; below that the saving is not worth the change
+DEDUPE_MIN_DUPLICATE_RATIO = 0.1
 
-FIRST_PASS_PROMPT = """You are a creative visual assistant helping to enhance a video with AI-generated images.
+TRANSCRIPT_FORMAT = "sentence ID -> text"
+DEDUPED_TRANSCRIPT_FORMAT = (
+    "sentence IDs -> text; a key such as \"3,17\" means that text is spoken "
+    "at each of those sentences, so list only the specific IDs the image "
+    "belongs to, never the combined key"
+)
 
-General instruction from the user:
-{general_instruction}
 
-Video transcript (sentence ID -> text):
-{sentences_json}
+FIRST_PASS_PROMPT = """You are a creative visual assistant helping to enhance a video with AI-generated images.
+
+The user message contains a general instruction from the user and the video transcript, keyed by sentence ID.
 
 Your task is to analyze the transcript and suggest images that would enhance the video. For each image:
 1. Identify which sentences it should appear over (by sentence ID)
@@ -31,33 +40,39 @@ Guidelines:
 - Avoid overlapping images (each sentence should have at most one image)
 
 Respond with a JSON object in this exact format:
-{{
+{
     "thoughts": "Your analysis of the transcript and image strategy",
     "images": [
-        {{
+        {
             "description": "Brief human-readable description",
             "sentence_ids": ["1", "2"],
             "detailed_prompt": "Detailed prompt for image generator, including style, composition, lighting, mood, etc."
-        }}
+        }
     ]
-}}
+}
 
 Example response:
-{{
+{
     "thoughts": "The video discusses dogs and their behavior. I'll create 2 images: one for the introduction about Corgis, and one for the section about training.",
     "images": [
-        {{
+        {
             "description": "A happy Corgi dog",
             "sentence_ids": ["1", "2"],
             "detailed_prompt": "A professional photograph of a happy Corgi dog with orange and white fur, sitting on green grass, bright natural lighting, shallow depth of field, high quality, photorealistic"
-        }},
-        {{
+        },
+        {
             "description": "Dog training session",
             "sentence_ids": ["5", "6"],
             "detailed_prompt": "A warm scene of a person training a dog with treats, indoor setting with soft lighting, focus on the connection between human and dog, professional photography, photorealistic"
-        }}
+        }
     ]
-}}
+}"""
+
+FIRST_PASS_INPUTS_TEMPLATE = """General instruction from the user:
+{general_instruction}
+
+Video transcript ({transcript_format}):
+{sentences_json}
 
 Now analyze the transcript and suggest images:"""
 
@@ -73,12 +88,12 @@ class ImagePlanningAgent:
         Initialize the Image Planning Agent.
 
         Args:
-            llm_service: LLM service to use. If None, creates default OpenRouterLLMService.
+            llm_service: LLM service to use. If None, uses the shared OpenRouterLLMService.
         """
-        self.llm_service = llm_service or OpenRouterLLMService(
-            temperature=0.7,  # Higher temperature for more creative image ideas
-            max_tokens=3000,
-        )
+        self.llm_service = llm_service or get_shared_llm_service()
+        # Passed per call, so a shared service can serve every agent
+        self.temperature = 0.7  # Higher temperature for more creative image ideas
+        self.max_tokens = 3000
 
     def plan_images_first_pass(
         self,
@@ -98,46 +113,71 @@ class ImagePlanningAgent:
         Raises:
             RuntimeError: If LLM fails to generate valid response
         """
-        # Create sentences dict for the prompt (sentence_id -> text)
-        sentences_dict = {
-            sentence.index: sentence.text for sentence in adjusted_sentences.sentences
-        }
-        sentences_json = json.dumps(sentences_dict, indent=2)
+        # Create sentences dict for the prompt (sentence_id -> text), sending
+        # repeated texts once under the list of every index that says them
+        text_to_indexes: dict[str, list[str]] = defaultdict(list)
+        for sentence in adjusted_sentences.sentences:
+            text_to_indexes[sentence.text].append(sentence.index)
+
+        sentence_count = len(adjusted_sentences.sentences)
+        duplicate_count = sentence_count - len(text_to_indexes)
+        dedupe = (
+            sentence_count > 0
+            and duplicate_count / sentence_count > DEDUPE_MIN_DUPLICATE_RATIO
+        )
+        if dedupe:
+            sentences_dict = {
+                ",".join(indexes): text for text, indexes in text_to_indexes.items()
+            }
+            transcript_format = DEDUPED_TRANSCRIPT_FORMAT
+        else:
+            sentences_dict = {
+                sentence.index: sentence.text
+                for sentence in adjusted_sentences.sentences
+            }
+            transcript_format = TRANSCRIPT_FORMAT
+        sentences_json = json.dumps(sentences_dict, separators=(",", ":"))
 
         # Format the prompt
-        prompt = FIRST_PASS_PROMPT.format(
+        prompt = FIRST_PASS_INPUTS_TEMPLATE.format(
             general_instruction=general_instruction,
+            transcript_format=transcript_format,
             sentences_json=sentences_json,
         )
 
         # Get LLM response
         try:
-            response_text = self.llm_service.complete(prompt=prompt)
-
-            # Parse JSON response
-            # Remove markdown code blocks if present
-            response_text = response_text.strip()
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            response_text = response_text.strip()
+            response_text = self.llm_service.complete(
+                prompt=prompt,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                system_blocks=[FIRST_PASS_PROMPT],
+            )
 
-            response_data = json.loads(response_text)
+            # Parse JSON response (ignores markdown fences around the object)
+            response_data = extract_and_parse(response_text)
 
             # Validate response structure
             if "images" not in response_data:
                 raise ValueError("Response missing 'images' field")
 
             # Convert to ImageDescription objects
+            valid_ids = {sentence.index for sentence in adjusted_sentences.sentences}
             image_descriptions = []
             for img_data in response_data["images"]:
+                sentence_ids = self._resolve_sentence_ids(
+                    img_data["sentence_ids"], valid_ids
+                )
+                if not sentence_ids:
+                    print(
+                        f"   ⚠ Warning: No valid sentences for image: "
+                        f"{img_data['description']}"
+                    )
+                    continue
                 image_desc = ImageDescription(
                     description=img_data["description"],
                     detailed_prompt=img_data["detailed_prompt"],
-                    sentence_ids=img_data["sentence_ids"],
+                    sentence_ids=sentence_ids,
                 )
                 image_descriptions.append(image_desc)
 
@@ -153,3 +193,30 @@ class ImagePlanningAgent:
             )
         except Exception as e:
             raise RuntimeError(f"Failed to generate image descriptions: {e}")
+
+    @staticmethod
+    def _resolve_sentence_ids(
+        sentence_ids: list[str], valid_ids: set[str]
+    ) -> list[str]:
+        """
+        Turn the sentence IDs returned by the LLM into real sentence indexes.
+
+        A combined key from the deduplicated prompt (e.g. "3,17") is split into
+        its IDs, and IDs that match no sentence are dropped with a warning.
+
+        Args:
+            sentence_ids: Sentence IDs returned by the LLM
+            valid_ids: Indexes of the sentences that were sent
+
+        Returns:
+            Valid sentence IDs, without duplicates, in the order returned
+        """
+        resolved: dict[str, None] = {}
+        for raw_id in sentence_ids:
+            for sentence_id in str(raw_id).split(","):
+                sentence_id = sentence_id.strip()
+                if sentence_id in valid_ids:
+                    resolved[sentence_id] = None
+                else:
+                    print(f"   ⚠ Warning: Sentence not found: {sentence_id}")
+        return list(resolved)
@@ -2,22 +2,28 @@
 Sentence Selection Agent - Interactive agent for selecting which sentences to keep/remove.
 """
 
-import json
+import re
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from pydantic_core import to_json
+
 from src.models import EditingResult, Transcript
 from src.services.llm.base import LLMService
-from src.services.llm.openrouter import OpenRouterLLMService
+from src.services.llm.openrouter import get_shared_llm_service
+from src.services.content_cache import ContentCache
+from src.services.agents._cache_utils import agent_cache_key
+from src.services.agents._json_utils import extract_and_parse
+from src.util import is_approval_feedback, normalize_feedback
 
 
+# The prompt is sent as a system prompt of two cacheable blocks (fixed
+# instructions, then the current state) followed by the user's feedback as the
+# only user message, so providers with prefix caching reuse both blocks across
+# feedback iterations.
 SENTENCE_SELECTION_AGENT_PROMPT = """You are a video editing assistant helping to select which sentences to keep or remove from a video based on user feedback.
 
-Current editing state (which sentences are kept or removed):
-{editing_result_json}
-
-User feedback:
-{user_feedback}
+The user's feedback is given in the user message.
 
 You have the following tools available:
 
@@ -29,21 +35,30 @@ You have the following tools available:
    Parameters:
    - sentence_index: The index of the sentence to remove (as a string)
 
-3. approve - Approve the current sentence selection and move to timestamp adjustments
+3. set_sentences - Keep or remove several sentences at once (prefer this over
+   repeating keep_sentence/remove_sentence)
+   Parameters:
+   - keep: true to keep the sentences, false to remove them
+   - indexes: List of sentence indexes (as strings), e.g. ["2", "7", "9"]
+   OR, for a consecutive run of sentences:
+   - start: First sentence index (as a string)
+   - end: Last sentence index, inclusive (as a string)
+
+4. approve - Approve the current sentence selection and move to timestamp adjustments
    No parameters needed.
 
 Based on the user's feedback, respond with a JSON object containing:
-{{
+{
     "thoughts": "Your analysis of the user's feedback and what actions to take",
     "actions": [
-        {{
+        {
             "tool": "tool_name",
-            "parameters": {{
+            "parameters": {
                 "param1": "value1"
-            }}
-        }}
+            }
+        }
     ]
-}}
+}
 
 If the user approves the sentence selection (e.g., "looks good", "perfect", "approve"), use the "approve" tool.
 If the user wants adjustments, analyze their feedback and use the appropriate tools.
@@ -51,11 +66,24 @@ If the user wants adjustments, analyze their feedback and use the appropriate to
 Examples:
 - "Remove sentence 5" -> remove_sentence with sentence_index "5"
 - "Keep sentence 3" -> keep_sentence with sentence_index "3"
-- "Remove sentences 10 through 15" -> multiple remove_sentence actions
+- "Remove sentences 10 through 15" -> set_sentences with start "10", end "15", keep false
+- "Keep sentences 2, 7 and 9" -> set_sentences with indexes ["2", "7", "9"], keep true
 - "The middle section is too long" -> analyze and suggest sentence removals
 - "Looks good" -> approve
 """
 
+# Feedback that is nothing but a keep/remove command over sentence numbers,
+# e.g. "remove 5", "cut sentences 3-6", "keep 3, 4 and 7"
+_FAST_PATH_PATTERN = re.compile(
+    r"(keep|remove|delete|cut)\s+(?:sentences?\s+)?"
+    r"(\d+(?:\s*(?:-|to|through|,?\s*and|,)\s*\d+)*)\.?"
+)
+_FAST_PATH_RANGE_PATTERN = re.compile(r"(\d+)(?:\s*(?:-|to|through)\s*(\d+))?")
+
+SENTENCE_SELECTION_STATE_TEMPLATE = """Current editing state (which sentences are kept or removed):
+{editing_result_json}
+"""
+
 
 class SentenceSelectionAgent:
     """
@@ -63,17 +91,23 @@ class SentenceSelectionAgent:
     Uses an LLM to interpret feedback and execute sentence selection actions.
     """
 
-    def __init__(self, llm_service: Optional[LLMService] = None):
+    def __init__(
+        self,
+        llm_service: Optional[LLMService] = None,
+        cache: Optional[ContentCache] = None,
+    ):
         """
         Initialize the Sentence Selection Agent.
 
         Args:
-            llm_service: LLM service to use. If None, creates default OpenRouterLLMService.
+            llm_service: LLM service to use. If None, uses the shared OpenRouterLLMService.
+            cache: Cache of LLM responses. Defaults to the "agent_responses" namespace.
         """
-        self.llm_service = llm_service or OpenRouterLLMService(
-            temperature=0.3,  # Lower temperature for more consistent editing decisions
-            max_tokens=2000,
-        )
+        self.llm_service = llm_service or get_shared_llm_service()
+        # Passed per call, so a shared service can serve every agent
+        self.temperature = 0.3  # Lower temperature for more consistent editing decisions
+        self.max_tokens = 2000
+        self.cache = cache or ContentCache("agent_responses")
 
     def process_feedback(
         self,
@@ -95,29 +129,23 @@ class SentenceSelectionAgent:
         Raises:
             RuntimeError: If LLM response cannot be parsed or actions fail
         """
-        # Convert editing result to JSON for the prompt
-        editing_result_json = self._editing_result_to_json(editing_result)
-
-        # Build prompt
-        prompt = SENTENCE_SELECTION_AGENT_PROMPT.format(
-            editing_result_json=editing_result_json,
-            user_feedback=user_feedback,
-        )
-
-        # Get LLM response
-        response_text = self.llm_service.complete(prompt)
-
-        # Parse response
-        try:
-            response_data = self._parse_response(response_text)
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to parse agent response: {str(e)}\nResponse: {response_text}"
-            ) from e
-
-        # Execute actions
-        thoughts = response_data.get("thoughts", "")
-        actions = response_data.get("actions", [])
+        # Plain approvals don't need the LLM to interpret them
+        if is_approval_feedback(user_feedback):
+            print("   ✓ Sentence selection approved!")
+            return editing_result, True
+
+        # Simple keep/remove commands are applied directly; anything else is
+        # interpreted by the LLM
+        actions = self._try_fast_path(editing_result, user_feedback)
+        new_cache_entry = None
+        if actions is None:
+            response_data, new_cache_entry = self._ask_llm(
+                editing_result, user_feedback
+            )
+            thoughts = response_data.get("thoughts", "")
+            actions = response_data.get("actions", [])
+        else:
+            thoughts = "Simple keep/remove command, applied without the LLM"
 
         print(f"\n🤖 Agent thoughts: {thoughts}\n")
 
@@ -137,11 +165,124 @@ class SentenceSelectionAgent:
                 updated_result = self._keep_sentence(updated_result, params)
             elif tool == "remove_sentence":
                 updated_result = self._remove_sentence(updated_result, params)
+            elif tool == "set_sentences":
+                updated_result = self._set_sentences(updated_result, params)
             else:
                 print(f"   ⚠ Warning: Unknown tool '{tool}'")
 
+        if new_cache_entry is not None:
+            self.cache.put(*new_cache_entry)
+
         return updated_result, is_approved
 
+    def _try_fast_path(
+        self, editing_result: EditingResult, user_feedback: str
+    ) -> Optional[list[Dict[str, Any]]]:
+        """
+        Turn feedback that is only a keep/remove command into actions locally.
+
+        Args:
+            editing_result: Current editing result
+            user_feedback: User's feedback text
+
+        Returns:
+            A single set_sentences action, or None if the feedback needs the
+            LLM (other wording, or sentence numbers that don't exist)
+        """
+        match = _FAST_PATH_PATTERN.fullmatch(user_feedback.strip().lower())
+        if not match:
+            return None
+
+        verb, spec = match.groups()
+        sentence_count = len(editing_result.sentence_results)
+        indexes: list[str] = []
+        for start, end in _FAST_PATH_RANGE_PATTERN.findall(spec):
+            first = int(start)
+            last = int(end) if end else first
+            # A range longer than the transcript can't be all valid sentences,
+            # so don't expand it
+            if last - first >= sentence_count:
+                return None
+            indexes.extend(str(i) for i in range(first, last + 1))
+
+        if not indexes or any(
+            index not in editing_result.sentence_results for index in indexes
+        ):
+            return None
+
+        return [
+            {
+                "tool": "set_sentences",
+                "parameters": {"indexes": indexes, "keep": verb == "keep"},
+            }
+        ]
+
+    def _ask_llm(
+        self, editing_result: EditingResult, user_feedback: str
+    ) -> tuple[Dict[str, Any], Optional[tuple[str, str]]]:
+        """
+        Get the agent's parsed response to feedback from the LLM (or the cache).
+
+        A new response is not cached here; the caller stores it once its
+        actions have been applied.
+
+        Args:
+            editing_result: Current editing result
+            user_feedback: User's feedback text
+
+        Returns:
+            Tuple of (response_data, new_cache_entry)
+            - response_data: Parsed response with thoughts and actions
+            - new_cache_entry: (key, response text) to cache, or None if the
+              response came from the cache
+
+        Raises:
+            RuntimeError: If the LLM response cannot be parsed
+        """
+        # Convert editing result to JSON for the prompt
+        editing_result_json = self._editing_result_to_json(editing_result)
+
+        # Build prompt: stable instructions and state first, feedback last
+        system_blocks = [
+            SENTENCE_SELECTION_AGENT_PROMPT,
+            SENTENCE_SELECTION_STATE_TEMPLATE.format(
+                editing_result_json=editing_result_json
+            ),
+        ]
+
+        # Get LLM response (same state + equivalent feedback reuses the cached one)
+        cache_key = agent_cache_key(
+            self.llm_service,
+            self.temperature,
+            self.max_tokens,
+            SENTENCE_SELECTION_AGENT_PROMPT,
+            SENTENCE_SELECTION_STATE_TEMPLATE,
+            editing_result_json,
+            normalize_feedback(user_feedback),
+        )
+        response_text = self.cache.get(cache_key)
+        is_cached = response_text is not None
+        if not is_cached:
+            response_text = self.llm_service.complete(
+                user_feedback,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                system_blocks=system_blocks,
+            )
+
+        # Parse response
+        try:
+            response_data = self._parse_response(response_text)
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to parse agent response: {str(e)}\nResponse: {response_text}"
+            ) from e
+
+        if is_cached:
+            print("\n♻️  Reusing cached agent response for identical feedback")
+            return response_data, None
+        return response_data, (cache_key, response_text)
+
     def _editing_result_to_json(self, editing_result: EditingResult) -> str:
         """
         Convert editing result to JSON format for the prompt.
@@ -152,16 +293,11 @@ class SentenceSelectionAgent:
         Returns:
             JSON string representation showing sentences and their keep/remove status
         """
-        sentences_list = []
-        for index, sentence_result in editing_result.sentence_results.items():
-            sentences_list.append(
-                {
-                    "index": index,
-                    "text": sentence_result.text,
-                    "keep": sentence_result.keep,
-                }
-            )
-        return json.dumps(sentences_list, indent=2)
+        sentences_list = [
+            {"index": index, "text": result.text, "keep": result.keep}
+            for index, result in editing_result.sentence_results.items()
+        ]
+        return to_json(sentences_list).decode()
 
     def _parse_response(self, response_text: str) -> Dict[str, Any]:
         """
@@ -176,14 +312,7 @@ class SentenceSelectionAgent:
         Raises:
             ValueError: If response cannot be parsed
         """
-        # Extract JSON from response (handle markdown code blocks)
-        start = response_text.find("{")
-        end = response_text.rfind("}")
-        if start == -1 or end == -1:
-            raise ValueError("No JSON object found in response")
-
-        json_text = response_text[start : end + 1]
-        return json.loads(json_text)
+        return extract_and_parse(response_text)
 
     def _keep_sentence(
         self,
@@ -252,3 +381,55 @@ class SentenceSelectionAgent:
         print(f"   ✓ Marked sentence {sentence_index} to be REMOVED")
 
         return editing_result
+
+    def _set_sentences(
+        self,
+        editing_result: EditingResult,
+        params: Dict[str, Any],
+    ) -> EditingResult:
+        """
+        Keep or remove several sentences in one action.
+
+        Args:
+            editing_result: Current editing result
+            params: Tool parameters (keep, and either indexes or start/end)
+
+        Returns:
+            Updated EditingResult
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        keep = params.get("keep")
+        if isinstance(keep, str):
+            keep = keep.strip().lower() == "true"
+        if not isinstance(keep, bool):
+            raise ValueError(f"Missing or invalid parameter keep: {params}")
+
+        if "indexes" in params:
+            indexes = [str(index) for index in params["indexes"]]
+        elif "start" in params and "end" in params:
+            try:
+                start, end = int(params["start"]), int(params["end"])
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid sentence range: {params}") from None
+            if end - start >= len(editing_result.sentence_results):
+                raise ValueError(f"Sentence range out of bounds: {params}")
+            indexes = [str(index) for index in range(start, end + 1)]
+        else:
+            raise ValueError(f"Missing required parameter indexes or start/end: {params}")
+
+        # Validate every index before changing anything
+        missing = [i for i in indexes if i not in editing_result.sentence_results]
+        if missing:
+            raise ValueError(
+                f"Sentences with indexes {', '.join(missing)} not found in editing result"
+            )
+
+        for index in indexes:
+            editing_result.sentence_results[index].keep = keep
+
+        action = "KEPT" if keep else "REMOVED"
+        print(f"   ✓ Marked {len(indexes)} sentences to be {action}: {', '.join(indexes)}")
+
+        return editing_result
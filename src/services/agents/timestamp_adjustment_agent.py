@@ -2,25 +2,30 @@
 Timestamp Adjustment Agent - Interactive agent for adjusting sentence timestamps based on user feedback.
 """
 
-import json
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-from src.models import AdjustedSentences
+from typing import Dict, Optional
+
+from src.models import (
+    AdjustActions,
+    AdjustedSentence,
+    AdjustedSentences,
+    AdjustTimestampAction,
+    ApproveAction,
+)
 from src.services.llm.base import LLMService
-from src.services.llm.openrouter import OpenRouterLLMService
+from src.services.llm.openrouter import get_shared_llm_service
+from src.services.content_cache import ContentCache
+from src.services.agents._cache_utils import agent_cache_key
+from src.services.agents._json_utils import extract_and_parse
+from src.util import is_approval_feedback, normalize_feedback
 
 
+# Sent as two cacheable system blocks (fixed instructions, then the current
+# state) followed by the user's feedback as the only user message; see
+# sentence_selection_agent.py.
 TIMESTAMP_ADJUSTMENT_AGENT_PROMPT = """You are a video editing assistant helping to adjust sentence timestamps based on user feedback.
 
-Current state of the video (adjusted sentences with timestamps):
-{adjusted_sentences_json}
-
-Note: Each sentence includes word-level timestamps in the "words" array. You can use these precise timestamps 
-to make fine-grained cuts at the word level when adjusting sentence boundaries.
-
-User feedback:
-{user_feedback}
+The user's feedback is given in the user message.
 
 You have the following tools available to adjust timestamps:
 
@@ -38,21 +43,23 @@ You have the following tools available to adjust timestamps:
    No parameters needed.
 
 Based on the user's feedback, respond with a JSON object containing:
-{{
+{
     "thoughts": "Your analysis of the user's feedback and what actions to take",
     "actions": [
-        {{
+        {
             "tool": "tool_name",
-            "parameters": {{
+            "parameters": {
                 "param1": "value1",
                 "param2": "value2"
-            }}
-        }}
+            }
+        }
     ]
-}}
+}
 
 If the user approves the video (e.g., "looks good", "perfect", "approve"), use the "approve" tool.
 If the user wants adjustments, analyze their feedback and use the appropriate tools.
+Return every adjustment the feedback calls for in one response, with one
+adjust_timestamp action per changed boundary (e.g. both ends of a gap).
 
 Examples:
 - "Cut 2 seconds from the beginning" -> adjust_timestamp on sentence 1's adjusted_start
@@ -63,6 +70,23 @@ Examples:
 Note: Sentence selection (keep/remove) is handled in a separate stage. This agent only adjusts timestamps.
 """
 
+TIMESTAMP_ADJUSTMENT_STATE_TEMPLATE = """Current state of the video (adjusted sentences with timestamps):
+{adjusted_sentences_json}
+
+Note: Each sentence includes word-level timestamps in the "words" array. You can use these precise timestamps 
+to make fine-grained cuts at the word level when adjusting sentence boundaries.
+"""
+
+# Structured output schema for the response above, passed as OpenRouter's
+# response_format to services that support it
+TIMESTAMP_ACTIONS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "timestamp_actions",
+        "schema": AdjustActions.model_json_schema(),
+    },
+}
+
 
 class TimestampAdjustmentAgent:
     """
@@ -70,17 +94,25 @@ class TimestampAdjustmentAgent:
     Uses an LLM to interpret feedback and execute timestamp adjustment actions.
     """
 
-    def __init__(self, llm_service: Optional[LLMService] = None):
+    def __init__(
+        self,
+        llm_service: Optional[LLMService] = None,
+        cache: Optional[ContentCache] = None,
+    ):
         """
         Initialize the Timestamp Adjustment Agent.
 
         Args:
-            llm_service: LLM service to use. If None, creates default OpenRouterLLMService.
+            llm_service: LLM service to use. If None, uses the shared OpenRouterLLMService.
+            cache: Cache of LLM responses. Defaults to the "agent_responses" namespace.
         """
-        self.llm_service = llm_service or OpenRouterLLMService(
-            temperature=0.3,  # Lower temperature for more consistent editing decisions
-            max_tokens=2000,
-        )
+        self.llm_service = llm_service or get_shared_llm_service()
+        # Passed per call, so a shared service can serve every agent
+        self.temperature = 0.3  # Lower temperature for more consistent editing decisions
+        self.max_tokens = 2000
+        self.cache = cache or ContentCache("agent_responses")
+        # Sentence index -> (fields the block was rendered from, rendered block)
+        self._sentence_blocks: dict[str, tuple[tuple, str]] = {}
 
     def process_feedback(
         self,
@@ -102,50 +134,84 @@ class TimestampAdjustmentAgent:
         Raises:
             RuntimeError: If LLM response cannot be parsed or actions fail
         """
+        # Plain approvals don't need the LLM to interpret them
+        if is_approval_feedback(user_feedback):
+            print("   ✓ Timestamps approved!")
+            return adjusted_sentences, True
+
         # Convert adjusted sentences to JSON for the prompt (include words for timestamp adjustment)
         sentences_json = self._sentences_to_json(adjusted_sentences, include_words=True)
 
-        # Build prompt
-        prompt = TIMESTAMP_ADJUSTMENT_AGENT_PROMPT.format(
-            adjusted_sentences_json=sentences_json,
-            user_feedback=user_feedback,
+        # Build prompt: stable instructions and state first, feedback last
+        system_blocks = [
+            TIMESTAMP_ADJUSTMENT_AGENT_PROMPT,
+            TIMESTAMP_ADJUSTMENT_STATE_TEMPLATE.format(
+                adjusted_sentences_json=sentences_json
+            ),
+        ]
+
+        # Get LLM response (same state + equivalent feedback reuses the cached one)
+        cache_key = agent_cache_key(
+            self.llm_service,
+            self.temperature,
+            self.max_tokens,
+            TIMESTAMP_ADJUSTMENT_AGENT_PROMPT,
+            TIMESTAMP_ADJUSTMENT_STATE_TEMPLATE,
+            repr(TIMESTAMP_ACTIONS_RESPONSE_FORMAT),
+            sentences_json,
+            normalize_feedback(user_feedback),
         )
-
-        # Get LLM response
-        response_text = self.llm_service.complete(prompt)
+        use_schema = self.llm_service.supports_response_format
+        response_text = self.cache.get(cache_key)
+        is_cached = response_text is not None
+        if not is_cached:
+            schema_kwargs = (
+                {"response_format": TIMESTAMP_ACTIONS_RESPONSE_FORMAT}
+                if use_schema
+                else {}
+            )
+            response_text = self.llm_service.complete(
+                user_feedback,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                system_blocks=system_blocks,
+                **schema_kwargs,
+            )
 
         # Parse response
         try:
-            response_data = self._parse_response(response_text)
+            response = self._parse_response(response_text, use_schema)
         except Exception as e:
             raise RuntimeError(
                 f"Failed to parse agent response: {str(e)}\nResponse: {response_text}"
             ) from e
 
+        if is_cached:
+            print("\n♻️  Reusing cached agent response for identical feedback")
+
         # Execute actions
-        thoughts = response_data.get("thoughts", "")
-        actions = response_data.get("actions", [])
+        print(f"\n🤖 Agent thoughts: {response.thoughts}\n")
 
-        print(f"\n🤖 Agent thoughts: {thoughts}\n")
+        # Built once so each adjust_timestamp action is a dict lookup
+        sentences_by_index = {
+            sentence.index: sentence for sentence in adjusted_sentences.sentences
+        }
+        handlers = {
+            "approve": self._approve,
+            "adjust_timestamp": self._adjust_timestamp,
+        }
 
         is_approved = False
-        updated_sentences = adjusted_sentences
-
-        for action in actions:
-            tool = action.get("tool")
-            params = action.get("parameters", {})
-
-            print(f"   Executing: {tool} with {params}")
-
-            if tool == "approve":
+        for action in response.actions:
+            params = action.model_dump(exclude={"tool"}).get("parameters", {})
+            print(f"   Executing: {action.tool} with {params}")
+            if handlers[action.tool](action, sentences_by_index):
                 is_approved = True
-                print("   ✓ Timestamps approved!")
-            elif tool == "adjust_timestamp":
-                updated_sentences = self._adjust_timestamp(updated_sentences, params)
-            else:
-                print(f"   ⚠ Warning: Unknown tool '{tool}'")
 
-        return updated_sentences, is_approved
+        if not is_cached:
+            self.cache.put(cache_key, response_text)
+
+        return adjusted_sentences, is_approved
 
     def _sentences_to_json(
         self, adjusted_sentences: AdjustedSentences, include_words: bool = True
@@ -160,97 +226,125 @@ class TimestampAdjustmentAgent:
         Returns:
             Formatted string representation
         """
-        lines = []
+        blocks = []
         for sentence in adjusted_sentences.sentences:
-            # Sentence header with index, text, and adjusted timestamps
-            lines.append(
-                f"Sentence {sentence.index}:\n"
-                f'"{sentence.text}" [{sentence.adjusted_start:.2f} - {sentence.adjusted_end:.2f}]'
+            # Feedback turns only move a few timestamps, so unchanged sentences
+            # reuse their rendered block (words never change between turns)
+            key = (
+                sentence.text,
+                sentence.adjusted_start,
+                sentence.adjusted_end,
+                include_words,
             )
+            cached = self._sentence_blocks.get(sentence.index)
+            if cached is not None and cached[0] == key:
+                blocks.append(cached[1])
+                continue
 
-            # Include word-level timestamps if available and requested
-            if include_words and hasattr(sentence, "words") and sentence.words:
-                for word in sentence.words:
-                    lines.append(f"[{word.start:.2f} - {word.end:.2f}] {word.word}")
+            block = self._format_sentence(sentence, include_words)
+            self._sentence_blocks[sentence.index] = (key, block)
+            blocks.append(block)
 
-            # Add blank line between sentences for readability
-            lines.append("")
+        return "\n".join(blocks)
+
+    @staticmethod
+    def _format_sentence(sentence: AdjustedSentence, include_words: bool) -> str:
+        """
+        Render one sentence block of the prompt state.
+
+        This is the canonical format: the state is sent as a cached prompt
+        prefix and hashed into response cache keys, so any change here (even
+        whitespace or float precision) invalidates both.
+
+        Args:
+            sentence: Sentence to render
+            include_words: Whether to include word-level timestamps
+
+        Returns:
+            Header line, one line per word, and a trailing newline that
+            separates it from the next block
+        """
+        # Sentence header with index, text, and adjusted timestamps
+        lines = [
+            f"Sentence {sentence.index}:\n"
+            f'"{sentence.text}" [{sentence.adjusted_start:.2f} - {sentence.adjusted_end:.2f}]'
+        ]
+
+        # Include word-level timestamps if available and requested
+        if include_words and sentence.words:
+            for word in sentence.words:
+                lines.append(f"[{word.start:.2f} - {word.end:.2f}] {word.word}")
+
+        # Add blank line between sentences for readability
+        lines.append("")
 
         return "\n".join(lines)
 
-    def _parse_response(self, response_text: str) -> Dict[str, Any]:
+    def _parse_response(self, response_text: str, use_schema: bool) -> AdjustActions:
         """
-        Parse LLM response JSON.
+        Parse and validate the LLM response.
 
         Args:
             response_text: Raw response text from LLM
+            use_schema: True if the response was constrained by
+                TIMESTAMP_ACTIONS_RESPONSE_FORMAT and is bare JSON
 
         Returns:
-            Parsed JSON dictionary
+            Validated actions
 
         Raises:
-            ValueError: If response cannot be parsed
+            ValueError: If response cannot be parsed or doesn't match the schema
+                (pydantic.ValidationError is a ValueError)
+        """
+        if use_schema:
+            return AdjustActions.model_validate_json(response_text)
+        # Without a schema the JSON may be wrapped in text or code fences
+        return AdjustActions.model_validate(extract_and_parse(response_text))
+
+    def _approve(
+        self,
+        action: ApproveAction,
+        sentences_by_index: Dict[str, AdjustedSentence],
+    ) -> bool:
         """
-        # Extract JSON from response (handle markdown code blocks)
-        start = response_text.find("{")
-        end = response_text.rfind("}")
-        if start == -1 or end == -1:
-            raise ValueError("No JSON object found in response")
+        Approve the current timestamps.
+
+        Args:
+            action: approve action
+            sentences_by_index: Sentence index -> sentence (unused)
 
-        json_text = response_text[start : end + 1]
-        return json.loads(json_text)
+        Returns:
+            True, since the timestamps are approved
+        """
+        print("   ✓ Timestamps approved!")
+        return True
 
     def _adjust_timestamp(
         self,
-        adjusted_sentences: AdjustedSentences,
-        params: Dict[str, Any],
-    ) -> AdjustedSentences:
+        action: AdjustTimestampAction,
+        sentences_by_index: Dict[str, AdjustedSentence],
+    ) -> bool:
         """
-        Adjust a timestamp for a sentence.
+        Adjust a timestamp for a sentence in place.
 
         Args:
-            adjusted_sentences: Current sentences
-            params: Tool parameters (sentence_index, field, new_value)
+            action: adjust_timestamp action (sentence_index, field, new_value)
+            sentences_by_index: Sentence index -> sentence being edited
 
         Returns:
-            Updated AdjustedSentences
+            False, since an adjustment doesn't approve the timestamps
 
         Raises:
-            ValueError: If parameters are invalid
+            ValueError: If the sentence doesn't exist
         """
-        sentence_index = params.get("sentence_index")
-        field = params.get("field")
-        new_value = params.get("new_value")
-
-        if not all([sentence_index, field, new_value is not None]):
-            raise ValueError(
-                f"Missing required parameters for adjust_timestamp: {params}"
-            )
-
-        # Find the sentence
-        for sentence in adjusted_sentences.sentences:
-            if sentence.index == sentence_index:
-                # Update the field
-                if field not in [
-                    "original_start",
-                    "original_end",
-                    "adjusted_start",
-                    "adjusted_end",
-                ]:
-                    raise ValueError(f"Invalid field: {field}")
-
-                # Validate new_value is a number
-                if new_value is None:
-                    raise ValueError("new_value cannot be None")
-                try:
-                    new_value_float = float(new_value)
-                except (TypeError, ValueError) as e:
-                    raise ValueError(f"Invalid timestamp value: {new_value}") from e
-
-                setattr(sentence, field, new_value_float)
-                print(
-                    f"   ✓ Adjusted sentence {sentence_index} {field} to {new_value_float}s"
-                )
-                return adjusted_sentences
-
-        raise ValueError(f"Sentence with index {sentence_index} not found")
+        params = action.parameters
+        sentence = sentences_by_index.get(params.sentence_index)
+        if sentence is None:
+            raise ValueError(f"Sentence with index {params.sentence_index} not found")
+
+        setattr(sentence, params.field, params.new_value)
+        print(
+            f"   ✓ Adjusted sentence {params.sentence_index} {params.field} "
+            f"to {params.new_value}s"
+        )
+        return False
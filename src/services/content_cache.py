@@ -0,0 +1,120 @@
+"""
+Content-addressed cache for expensive pipeline results.
+Stores text payloads (typically JSON) keyed by a SHA-256 digest of their inputs.
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+from src.constants import CACHE_DIR
+
+
+class ContentCache:
+    """
+    On-disk cache where each entry is addressed by a hash of its inputs.
+
+    Entries live in {cache_dir}/{namespace}/{key}.json, so identical inputs
+    (e.g. the same audio file or the same prompt) map to the same file across
+    runs and across base names.
+    """
+
+    def __init__(self, namespace: str, cache_dir: Path | str | None = None):
+        """
+        Initialize content cache.
+
+        Args:
+            namespace: Sub-folder separating unrelated kinds of entries
+            cache_dir: Root cache directory. Defaults to constant.
+        """
+        self.cache_dir = (Path(cache_dir) if cache_dir else CACHE_DIR) / namespace
+
+    @staticmethod
+    def hash_file(path: str | Path) -> str:
+        """
+        Compute the SHA-256 digest of a file's contents.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            Hex digest string
+        """
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    @staticmethod
+    def hash_text(*parts: str) -> str:
+        """
+        Compute the SHA-256 digest of one or more text parts.
+
+        Args:
+            *parts: Text values to hash (order matters)
+
+        Returns:
+            Hex digest string
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """
+        Get the file path for a cache key.
+
+        Args:
+            key: Cache key (hex digest)
+
+        Returns:
+            Path to the cache entry
+        """
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a cache entry.
+
+        Args:
+            key: Cache key (hex digest)
+
+        Returns:
+            Cached content, or None on a miss
+        """
+        path = self.path_for(key)
+        if not path.exists():
+            return None
+        return path.read_text(encoding="utf-8")
+
+    def put(self, key: str, content: str) -> Path:
+        """
+        Store a cache entry atomically.
+
+        Args:
+            key: Cache key (hex digest)
+            content: Content to store
+
+        Returns:
+            Path to the cache entry
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
+        return path
+
+    def clear(self) -> int:
+        """
+        Delete every entry in this cache's namespace.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.cache_dir.exists():
+            return 0
+        count = sum(1 for _ in self.cache_dir.glob("*.json"))
+        shutil.rmtree(self.cache_dir)
+        return count
@@ -8,6 +8,15 @@ from pathlib import Path
 from bs4 import BeautifulSoup, Tag
 from src.models import GoogleDocScript, GoogleDocLine
 
+# BeautifulSoup tree builder: lxml's C parser when installed, which is much
+# faster on large exports, otherwise the pure-Python stdlib parser
+try:
+    import lxml  # type: ignore # noqa: F401
+
+    HTML_PARSER_FEATURES = "lxml"
+except ImportError:
+    HTML_PARSER_FEATURES = "html.parser"
+
 
 class GoogleDocHTMLParser:
     """
@@ -27,7 +36,7 @@ class GoogleDocHTMLParser:
         Returns:
             GoogleDocScript with lines and image associations
         """
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, HTML_PARSER_FEATURES)
 
         lines = []
         current_text = None
@@ -5,16 +5,23 @@ OpenRouter image generation service.
 import asyncio
 import base64
 import os
+import shutil
 from pathlib import Path
+from typing import Optional
 import httpx
+from src.services.content_cache import ContentCache
 from src.services.image_generation.base import ImageGeneratorService
-from src.util import print_progress
+from src.util import ensure_env_loaded, print_progress
 from src.constants import (
     ENV_OPENROUTER_API_KEY,
     OPENROUTER_API_URL,
     OpenRouterImageModel,
 )
 
+# Base64 characters decoded per write when saving an image (a multiple of 4,
+# so every chunk decodes on its own)
+BASE64_CHUNK_CHARS = 64 * 1024
+
 
 class OpenRouterImageGenerator(ImageGeneratorService):
     """
@@ -24,19 +31,23 @@ class OpenRouterImageGenerator(ImageGeneratorService):
 
     def __init__(
         self,
-        model: OpenRouterImageModel | str = OpenRouterImageModel.GEMINI_25_FLASH_IMAGE,
+        model: str = OpenRouterImageModel.GEMINI_25_FLASH_IMAGE,
         api_key: str | None = None,
+        cache: Optional[ContentCache] = None,
     ):
         """
         Initialize OpenRouter image generation service.
 
         Args:
-            model: Image model to use (OpenRouterImageModel enum or string)
+            model: Image model identifier (e.g. an OpenRouterImageModel constant)
             api_key: OpenRouter API key. If None, reads from OPENROUTER_API_KEY env var.
+            cache: Cache of generated images. Defaults to the "generated_images" namespace.
 
         Raises:
             ValueError: If API key is not provided or found in environment
         """
+        if not api_key:
+            ensure_env_loaded()
         self.api_key = api_key or os.getenv(ENV_OPENROUTER_API_KEY)
         if not self.api_key:
             raise ValueError(
@@ -44,9 +55,9 @@ class OpenRouterImageGenerator(ImageGeneratorService):
                 "or pass api_key parameter."
             )
 
-        # Convert enum to string value if needed
-        self.model = model.value if isinstance(model, OpenRouterImageModel) else model
+        self.model = model
         self.api_url = OPENROUTER_API_URL
+        self.cache = cache or ContentCache("generated_images")
 
     async def generate_image(
         self,
@@ -67,62 +78,165 @@ class OpenRouterImageGenerator(ImageGeneratorService):
         Returns:
             Path to the saved image file
 
+        Raises:
+            RuntimeError: If image generation fails
+        """
+        if self._copy_from_cache(prompt, output_path, width, height):
+            return output_path
+
+        async with httpx.AsyncClient(timeout=120.0) as client:
+            await self._generate_image_with_client(client, prompt, output_path)
+        self._store_in_cache(prompt, output_path, width, height)
+        return output_path
+
+    def _cached_image_path(
+        self, prompt: str, output_path: Path, width: int, height: int
+    ) -> Path:
+        """
+        Get the cache location for an image generated from a prompt.
+
+        Args:
+            prompt: Text description of the image
+            output_path: Requested output path (its suffix is kept)
+            width: Image width in pixels
+            height: Image height in pixels
+
+        Returns:
+            Path of the cache entry, which may not exist yet
+        """
+        key = ContentCache.hash_text(self.model, prompt, f"{width}x{height}")
+        return self.cache.cache_dir / f"{key}{output_path.suffix}"
+
+    def _copy_from_cache(
+        self, prompt: str, output_path: Path, width: int, height: int
+    ) -> bool:
+        """
+        Copy a previously generated image for the same prompt to output_path.
+
+        Args:
+            prompt: Text description of the image
+            output_path: Where to save the image
+            width: Image width in pixels
+            height: Image height in pixels
+
+        Returns:
+            True if the image came from the cache, False on a miss
+        """
+        cached_path = self._cached_image_path(prompt, output_path, width, height)
+        if not cached_path.exists():
+            return False
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cached_path, output_path)
+        print_progress(f"Reused cached image for: {prompt[:50]}...")
+        return True
+
+    def _store_in_cache(
+        self, prompt: str, output_path: Path, width: int, height: int
+    ) -> None:
+        """
+        Store a freshly generated image in the cache (atomically).
+
+        Args:
+            prompt: Text description of the image
+            output_path: Generated image file
+            width: Image width in pixels
+            height: Image height in pixels
+        """
+        cached_path = self._cached_image_path(prompt, output_path, width, height)
+        cached_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cached_path.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(output_path, tmp_path)
+        os.replace(tmp_path, cached_path)
+
+    async def _generate_image_with_client(
+        self,
+        client: httpx.AsyncClient,
+        prompt: str,
+        output_path: Path,
+    ) -> Path:
+        """
+        Generate an image using an already open HTTP client.
+
+        Args:
+            client: HTTP client to send the request with (may be shared)
+            prompt: Text description of the image to generate
+            output_path: Where to save the generated image
+
+        Returns:
+            Path to the saved image file
+
         Raises:
             RuntimeError: If image generation fails
         """
         print_progress(f"Generating image with {self.model}: {prompt[:50]}...")
 
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                # Request image generation
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": prompt,
-                            }
-                        ],
-                        "modalities": ["image", "text"],
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
+            # Request image generation
+            response = await client.post(
+                self.api_url,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": self.model,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": prompt,
+                        }
+                    ],
+                    "modalities": ["image", "text"],
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
 
-                # Extract image from response
-                if not data.get("choices"):
-                    raise RuntimeError("No choices in OpenRouter response")
+            # Extract image from response
+            if not data.get("choices"):
+                raise RuntimeError("No choices in OpenRouter response")
 
-                message = data["choices"][0]["message"]
-                if not message.get("images"):
-                    raise RuntimeError("No images in OpenRouter response")
+            message = data["choices"][0]["message"]
+            if not message.get("images"):
+                raise RuntimeError("No images in OpenRouter response")
 
-                # Get the first image (base64 data URL)
-                image_data_url = message["images"][0]["image_url"]["url"]
+            # Get the first image (base64 data URL)
+            image_data_url = message["images"][0]["image_url"]["url"]
 
-                # Parse base64 data URL (format: data:image/png;base64,...)
-                if not image_data_url.startswith("data:"):
-                    raise RuntimeError(
-                        f"Unexpected image URL format: {image_data_url[:50]}"
-                    )
+            # Parse base64 data URL (format: data:image/png;base64,...)
+            if not image_data_url.startswith("data:"):
+                raise RuntimeError(
+                    f"Unexpected image URL format: {image_data_url[:50]}"
+                )
 
-                # Extract base64 data
-                header, base64_data = image_data_url.split(",", 1)
-                image_bytes = base64.b64decode(base64_data)
+            # Extract base64 data, without the whitespace b64decode would skip
+            # (it would shift the chunk boundaries below off 4-character groups)
+            header, base64_data = image_data_url.split(",", 1)
+            base64_data = "".join(base64_data.split())
 
-                # Save to file
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_path, "wb") as f:
-                    f.write(image_bytes)
+            # Decode straight into the file in chunks rather than holding
+            # a second, decoded copy of the image in memory. Written under a
+            # temporary name so a failed decode never leaves a truncated image
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            partial_path = output_path.with_name(
+                f"{output_path.stem}.partial{output_path.suffix}"
+            )
+            try:
+                with open(partial_path, "wb") as f:
+                    for start in range(0, len(base64_data), BASE64_CHUNK_CHARS):
+                        f.write(
+                            base64.b64decode(
+                                base64_data[start : start + BASE64_CHUNK_CHARS],
+                                validate=True,
+                            )
+                        )
+                os.replace(partial_path, output_path)
+            except BaseException:
+                partial_path.unlink(missing_ok=True)
+                raise
 
-                print_progress(f"Image saved to: {output_path}")
-                return output_path
+            print_progress(f"Image saved to: {output_path}")
+            return output_path
 
         except httpx.HTTPStatusError as e:
             error_msg = (
@@ -164,22 +278,48 @@ class OpenRouterImageGenerator(ImageGeneratorService):
         semaphore = asyncio.Semaphore(max_concurrent)
         results = []
 
-        async def generate_with_semaphore(prompt: str, path: Path) -> Path | None:
-            async with semaphore:
-                try:
-                    return await self.generate_image(prompt, path, width, height)
-                except Exception as e:
-                    print_progress(
-                        f"Failed to generate image for prompt '{prompt[:30]}...': {e}"
-                    )
-                    return None
-
-        # Generate all images concurrently
-        tasks = [generate_with_semaphore(prompt, path) for prompt, path in prompts]
-        completed = await asyncio.gather(*tasks, return_exceptions=False)
-
-        # Filter out failed generations
-        results = [path for path in completed if path is not None]
+        # Identical prompts are generated once and copied to the other paths
+        paths_by_prompt: dict[str, list[Path]] = {}
+        for prompt, path in prompts:
+            paths_by_prompt.setdefault(prompt, []).append(path)
+
+        async def generate_with_semaphore(
+            client: httpx.AsyncClient, prompt: str, paths: list[Path]
+        ) -> list[Path]:
+            first_path = paths[0]
+            if not self._copy_from_cache(prompt, first_path, width, height):
+                async with semaphore:
+                    try:
+                        await self._generate_image_with_client(
+                            client, prompt, first_path
+                        )
+                    except Exception as e:
+                        print_progress(
+                            f"Failed to generate image for prompt '{prompt[:30]}...': {e}"
+                        )
+                        return []
+                self._store_in_cache(prompt, first_path, width, height)
+
+            for path in paths[1:]:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(first_path, path)
+            return paths
+
+        # Generate all images concurrently over one pooled client, so requests
+        # after the first reuse open connections instead of handshaking again
+        limits = httpx.Limits(
+            max_connections=max_concurrent, max_keepalive_connections=max_concurrent
+        )
+        async with httpx.AsyncClient(timeout=120.0, limits=limits) as client:
+            tasks = [
+                generate_with_semaphore(client, prompt, paths)
+                for prompt, paths in paths_by_prompt.items()
+            ]
+            completed = await asyncio.gather(*tasks, return_exceptions=False)
+
+        # Filter out failed generations, keeping the requested order
+        generated = {path for paths in completed for path in paths}
+        results = [path for _, path in prompts if path in generated]
 
         if not results:
             raise RuntimeError("All image generations failed")
@@ -81,6 +81,10 @@ class LLMService(ABC):
     Implementations handle provider-specific API details.
     """
 
+    # True if complete() accepts a response_format JSON schema and the
+    # provider returns bare JSON matching it
+    supports_response_format: bool = False
+
     @abstractmethod
     def complete(self, prompt: str, **kwargs: Any) -> str:
         """
@@ -106,13 +110,14 @@ class LLMService(ABC):
             transcript: Transcript object
 
         Returns:
-            JSON string with format {"1": "[start-end]-sentence", "2": ...}
+            Compact JSON string (no whitespace, which would only cost prompt
+            tokens) with format {"1": "[start-end]-sentence", "2": ...}
         """
         sentences = prepare_transcript_for_prompt(transcript)
         sentences_dict = {
             str(i): str(sentence) for i, sentence in enumerate(sentences, 1)
         }
-        return json.dumps(sentences_dict, indent=2)
+        return json.dumps(sentences_dict, separators=(",", ":"))
 
     def _save_debug_log(self, prompt: str, output: str) -> None:
         """
@@ -4,8 +4,8 @@ Provides access to multiple LLM providers through OpenRouter API.
 """
 
 import os
-import json
 import requests  # type: ignore
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from src.services.llm.base import LLMService, EDITING_PROMPT_TEMPLATE
@@ -15,6 +15,7 @@ from src.constants import (
     OPENROUTER_API_URL,
     OpenRouterModel,
 )
+from src.util import ensure_env_loaded, print_progress
 
 
 class OpenRouterLLMService(LLMService):
@@ -23,9 +24,11 @@ class OpenRouterLLMService(LLMService):
     Supports various models through a unified interface.
     """
 
+    supports_response_format = True
+
     def __init__(
         self,
-        model: OpenRouterModel | str = OpenRouterModel.GEMINI_25_FLASH,
+        model: str = OpenRouterModel.GEMINI_25_FLASH,
         api_key: str | None = None,
         temperature: float = 0.7,
         max_tokens: int = 2000,
@@ -34,7 +37,7 @@ class OpenRouterLLMService(LLMService):
         Initialize OpenRouter LLM service.
 
         Args:
-            model: Model to use (OpenRouterModel enum or string identifier)
+            model: Model identifier (e.g. an OpenRouterModel constant)
             api_key: OpenRouter API key. If None, reads from environment.
             temperature: Sampling temperature (0.0 - 2.0)
             max_tokens: Maximum tokens in response
@@ -42,6 +45,8 @@ class OpenRouterLLMService(LLMService):
         Raises:
             ValueError: If API key is not provided or found in environment
         """
+        if not api_key:
+            ensure_env_loaded()
         self.api_key = api_key or os.getenv(ENV_OPENROUTER_API_KEY)
         if not self.api_key:
             raise ValueError(
@@ -49,26 +54,32 @@ class OpenRouterLLMService(LLMService):
                 f"Provide via constructor or {ENV_OPENROUTER_API_KEY} env var."
             )
 
-        # Convert enum to string value if needed
-        self.model = model.value if isinstance(model, OpenRouterModel) else model
+        self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.api_url = OPENROUTER_API_URL
+        # Keep-alive session so repeated calls (agents, feedback loop) reuse
+        # one TLS connection instead of handshaking per request
+        self._session = requests.Session()
 
     def complete(
         self,
         prompt: str,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        system_blocks: Optional[list[str]] = None,
         **kwargs: Any,
     ) -> str:
         """
         Generate a completion using OpenRouter API.
 
         Args:
-            prompt: Input prompt text
+            prompt: Input prompt text (sent as the user message)
             temperature: Override default temperature
             max_tokens: Override default max tokens
+            system_blocks: System prompt parts, each marked for provider-side
+                prompt caching. Put stable text first and keep anything that
+                varies per call in the prompt.
             **kwargs: Additional OpenRouter parameters
 
         Returns:
@@ -80,16 +91,18 @@ class OpenRouterLLMService(LLMService):
         try:
             response = self._call_api(
                 prompt=prompt,
-                temperature=temperature or self.temperature,
-                max_tokens=max_tokens or self.max_tokens,
+                temperature=self.temperature if temperature is None else temperature,
+                max_tokens=self.max_tokens if max_tokens is None else max_tokens,
+                system_blocks=system_blocks,
                 **kwargs,
             )
 
             # Extract text from response
             output = self._extract_text(response)
+            self._log_cache_usage(response)
 
             # Save debug log
-            self._save_debug_log(prompt, output)
+            self._save_debug_log("\n\n".join([*(system_blocks or []), prompt]), output)
 
             return output
 
@@ -98,12 +111,16 @@ class OpenRouterLLMService(LLMService):
         except Exception as e:
             raise RuntimeError(f"OpenRouter completion failed: {str(e)}") from e
 
-    def get_edits(self, transcript: Transcript) -> EditingDecision:
+    def get_edits(
+        self, transcript: Transcript, sentences_json: str | None = None
+    ) -> EditingDecision:
         """
         Get editing decisions for a transcript.
 
         Args:
             transcript: Transcript object
+            sentences_json: Output of transcript_to_sentences_json(transcript),
+                if the caller already built it
 
         Returns:
             EditingDecision object with thoughts and sentences to remove
@@ -112,7 +129,8 @@ class OpenRouterLLMService(LLMService):
             RuntimeError: If API call or parsing fails
         """
         # Convert transcript to JSON format
-        sentences_json = self.transcript_to_sentences_json(transcript)
+        if sentences_json is None:
+            sentences_json = self.transcript_to_sentences_json(transcript)
 
         # Build prompt
         prompt = EDITING_PROMPT_TEMPLATE.format(sentences_json=sentences_json)
@@ -126,15 +144,20 @@ class OpenRouterLLMService(LLMService):
             start = response_text.find("{")
             end = response_text.rfind("}")
             response_text = response_text[start : end + 1]
-            response_json = json.loads(response_text)
-            return EditingDecision(**response_json)
+            # Parse and validate in one pass inside pydantic-core
+            return EditingDecision.model_validate_json(response_text)
         except Exception as e:
             raise RuntimeError(
                 f"Failed to parse LLM response: {str(e)} on text: {response_text}"
             ) from e
 
     def _call_api(
-        self, prompt: str, temperature: float, max_tokens: int, **kwargs: Any
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        system_blocks: Optional[list[str]] = None,
+        **kwargs: Any,
     ) -> Dict[str, Any]:
         """
         Call OpenRouter API with the given parameters.
@@ -143,6 +166,7 @@ class OpenRouterLLMService(LLMService):
             prompt: Input prompt
             temperature: Sampling temperature
             max_tokens: Maximum tokens
+            system_blocks: Cacheable system prompt parts, if any
             **kwargs: Additional parameters
 
         Returns:
@@ -156,21 +180,54 @@ class OpenRouterLLMService(LLMService):
             "Content-Type": "application/json",
         }
 
+        messages: list[Dict[str, Any]] = []
+        if system_blocks:
+            # cache_control breakpoints are honoured by Anthropic and Gemini
+            # models; OpenAI models cache matching prefixes automatically
+            messages.append(
+                {
+                    "role": "system",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": block,
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                        for block in system_blocks
+                    ],
+                }
+            )
+        messages.append({"role": "user", "content": prompt})
+
         payload = {
             "model": self.model,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
             **kwargs,
         }
 
-        response = requests.post(
+        response = self._session.post(
             self.api_url, headers=headers, json=payload, timeout=120
         )
 
         response.raise_for_status()
         return response.json()
 
+    def _log_cache_usage(self, response: Dict[str, Any]) -> None:
+        """
+        Report how many prompt tokens were served from the provider's cache.
+
+        Args:
+            response: API response dictionary
+        """
+        usage = response.get("usage") or {}
+        cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+        if cached_tokens:
+            print_progress(
+                f"Prompt cache hit: {cached_tokens}/{usage.get('prompt_tokens')} tokens"
+            )
+
     def _extract_text(self, response: Dict[str, Any]) -> str:
         """
         Extract text from OpenRouter API response.
@@ -198,3 +255,18 @@ class OpenRouterLLMService(LLMService):
             raise ValueError(
                 f"Unexpected OpenRouter response format: {response}"
             ) from e
+
+
+@lru_cache(maxsize=1)
+def get_shared_llm_service() -> OpenRouterLLMService:
+    """
+    Get the process-wide OpenRouter service.
+
+    Agents and pipeline steps default to this instance so their requests go
+    through one keep-alive session; each caller passes its own temperature
+    and max_tokens per call.
+
+    Returns:
+        Shared OpenRouterLLMService with default settings
+    """
+    return OpenRouterLLMService()
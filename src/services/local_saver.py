@@ -4,6 +4,10 @@ Local file saver service for storing and loading transcriptions.
 
 import json
 from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import to_json
 
 from src.models import (
     Transcript,
@@ -25,10 +29,53 @@ from src.util import (
     get_google_doc_images_folder,
     get_google_doc_script_path,
     get_google_doc_image_placements_path,
+    get_inputs_record_path,
+    get_file_fingerprints,
 )
 from src.constants import ASSETS_DIR
 
 
+def _read_file(path: Path, description: str) -> bytes:
+    """
+    Read a saved asset, raising a descriptive error if it is missing.
+
+    Opens the file directly instead of checking exists() first, so each load
+    is one filesystem lookup and cannot race with the file being removed.
+
+    Args:
+        path: Path to the asset
+        description: Human-readable asset name for the error message
+
+    Returns:
+        File contents
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{description} not found: {path}") from None
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _write_model(path: Path, model: BaseModel, indent: int | None = 2) -> None:
+    """
+    Write a Pydantic model to a JSON file.
+
+    Serializes straight to UTF-8 bytes in pydantic-core, skipping the
+    intermediate Python str that model_dump_json() + write_text() build.
+
+    Args:
+        path: Destination file
+        model: Model to serialize
+        indent: JSON indentation, or None for compact output
+    """
+    path.write_bytes(to_json(model, indent=indent))
+
+
 class LocalSaverService:
     """
     Service for saving and loading transcriptions locally.
@@ -37,25 +84,86 @@ class LocalSaverService:
 
     LAST_FILENAME_PATH = ASSETS_DIR / ".last_filename"
 
-    def save_transcription(self, base_name: str, transcript: Transcript) -> Path:
+    def __init__(self):
+        """Initialize saver with empty last-filename and load caches."""
+        self._last_filename: str | None = None
+        self._last_filename_loaded = False
+        # path -> ((mtime_ns, size), model) for artifacts reloaded across steps
+        self._loaded: dict[Path, tuple[tuple[int, int], BaseModel]] = {}
+
+    def _remember(self, path: Path, model: BaseModel) -> None:
+        """
+        Cache a model as the parsed contents of the file just written for it.
+
+        Args:
+            path: File the model was saved to
+            model: Saved model (the caller must not modify it afterwards)
+        """
+        stat = path.stat()
+        self._loaded[path] = ((stat.st_mtime_ns, stat.st_size), model)
+
+    def _load_cached(
+        self, path: Path, model_type: type[ModelT], description: str
+    ) -> ModelT:
+        """
+        Load a model from JSON, reusing the parsed object while the file is
+        unchanged (same modification time and size).
+
+        Args:
+            path: File to load
+            model_type: Pydantic model class to validate into
+            description: Human-readable asset name for the error message
+
+        Returns:
+            Parsed model, shared with other callers
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{description} not found: {path}") from None
+
+        version = (stat.st_mtime_ns, stat.st_size)
+        entry = self._loaded.get(path)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        model = model_type.model_validate_json(_read_file(path, description))
+        self._loaded[path] = (version, model)
+        return model
+
+    def save_transcription(
+        self, base_name: str, transcript: Transcript, pretty: bool = False
+    ) -> Path:
         """
         Save transcription to JSON file.
 
+        The transcript is mostly word timestamps and is never edited by hand,
+        so it is written as compact JSON unless pretty output is requested.
+
         Args:
             base_name: Base filename without extension
             transcript: Transcript object to save
+            pretty: If True, indent the JSON for manual inspection
 
         Returns:
             Path to saved transcription file
         """
         path = get_transcription_path(base_name)
-        path.write_text(transcript.model_dump_json(indent=2))
+        indent = 2 if pretty else None
+        _write_model(path, transcript, indent=indent)
+        self._remember(path, transcript)
         return path
 
     def load_transcription(self, base_name: str) -> Transcript:
         """
         Load transcription from JSON file.
 
+        The parsed transcript is cached until the file changes, so later steps
+        get the same object without re-parsing; callers must not modify it.
+
         Args:
             base_name: Base filename without extension
 
@@ -66,11 +174,7 @@ class LocalSaverService:
             FileNotFoundError: If transcription file doesn't exist
         """
         path = get_transcription_path(base_name)
-        if not path.exists():
-            raise FileNotFoundError(f"Transcription not found: {path}")
-
-        data = json.loads(path.read_text())
-        return Transcript(**data)
+        return self._load_cached(path, Transcript, "Transcription")
 
     def transcription_exists(self, base_name: str) -> bool:
         """
@@ -108,15 +212,64 @@ class LocalSaverService:
         """
         return get_audio_path(base_name).exists()
 
+    def output_is_current(self, output_path: Path, input_paths: list[Path]) -> bool:
+        """
+        Check that an output exists and was generated from its current inputs.
+
+        Compares the inputs' modification time and size against the record
+        written by record_output_inputs, so a re-imported or re-generated
+        input invalidates outputs derived from it. Outputs without a record
+        (from older runs) and inputs that no longer exist are not treated
+        as stale.
+
+        Args:
+            output_path: Path to the generated asset
+            input_paths: Files the asset was generated from
+
+        Returns:
+            True if the output can be reused, False if it must be regenerated
+        """
+        if not output_path.exists():
+            return False
+
+        record_path = get_inputs_record_path(output_path)
+        try:
+            recorded = json.loads(record_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return True
+
+        current = get_file_fingerprints(input_paths)
+        return all(
+            fingerprint is None or recorded.get(path) == fingerprint
+            for path, fingerprint in current.items()
+        )
+
+    def record_output_inputs(self, output_path: Path, input_paths: list[Path]) -> None:
+        """
+        Record which versions of its inputs an output was generated from.
+
+        Args:
+            output_path: Path to the generated asset
+            input_paths: Files the asset was generated from
+        """
+        record_path = get_inputs_record_path(output_path)
+        record_path.write_text(
+            json.dumps(get_file_fingerprints(input_paths)), encoding="utf-8"
+        )
+
     def save_last_filename(self, base_name: str) -> None:
         """Save the last used filename."""
         self.LAST_FILENAME_PATH.write_text(base_name)
+        self._last_filename = base_name
+        self._last_filename_loaded = True
 
     def get_last_filename(self) -> str | None:
         """Get the last used filename, or None if none exists."""
-        if self.LAST_FILENAME_PATH.exists():
-            return self.LAST_FILENAME_PATH.read_text().strip()
-        return None
+        if not self._last_filename_loaded:
+            if self.LAST_FILENAME_PATH.exists():
+                self._last_filename = self.LAST_FILENAME_PATH.read_text().strip()
+            self._last_filename_loaded = True
+        return self._last_filename
 
     def save_editing_decision(self, base_name: str, decision: EditingDecision) -> Path:
         """
@@ -130,7 +283,7 @@ class LocalSaverService:
             Path to saved editing decision file
         """
         path = get_editing_decision_path(base_name)
-        path.write_text(decision.model_dump_json(indent=2))
+        _write_model(path, decision)
         return path
 
     def load_editing_decision(self, base_name: str) -> EditingDecision:
@@ -147,11 +300,8 @@ class LocalSaverService:
             FileNotFoundError: If editing decision file doesn't exist
         """
         path = get_editing_decision_path(base_name)
-        if not path.exists():
-            raise FileNotFoundError(f"Editing decision not found: {path}")
-
-        data = json.loads(path.read_text())
-        return EditingDecision(**data)
+        data = _read_file(path, "Editing decision")
+        return EditingDecision.model_validate_json(data)
 
     def editing_decision_exists(self, base_name: str) -> bool:
         """
@@ -177,13 +327,17 @@ class LocalSaverService:
             Path to saved editing result file
         """
         path = get_editing_result_path(base_name)
-        path.write_text(result.model_dump_json(indent=2))
+        _write_model(path, result)
+        self._remember(path, result.model_copy(deep=True))
         return path
 
     def load_editing_result(self, base_name: str) -> EditingResult:
         """
         Load editing result from JSON file.
 
+        Parsed results are cached until the file changes; each call returns
+        its own copy, since the feedback agents modify results in place.
+
         Args:
             base_name: Base filename without extension
 
@@ -194,11 +348,8 @@ class LocalSaverService:
             FileNotFoundError: If editing result file doesn't exist
         """
         path = get_editing_result_path(base_name)
-        if not path.exists():
-            raise FileNotFoundError(f"Editing result not found: {path}")
-
-        data = json.loads(path.read_text())
-        return EditingResult(**data)
+        result = self._load_cached(path, EditingResult, "Editing result")
+        return result.model_copy(deep=True)
 
     def editing_result_exists(self, base_name: str) -> bool:
         """
@@ -218,6 +369,9 @@ class LocalSaverService:
         """
         Save adjusted sentences to JSON file.
 
+        Kept as indented JSON: this file is meant to be edited by hand to
+        fine-tune timing, and holds one small record per kept sentence.
+
         Args:
             base_name: Base filename without extension
             adjusted_sentences: AdjustedSentences object to save
@@ -226,13 +380,17 @@ class LocalSaverService:
             Path to saved adjusted sentences file
         """
         path = get_adjusted_sentences_path(base_name)
-        path.write_text(adjusted_sentences.model_dump_json(indent=2))
+        _write_model(path, adjusted_sentences)
+        self._remember(path, adjusted_sentences.model_copy(deep=True))
         return path
 
     def load_adjusted_sentences(self, base_name: str) -> AdjustedSentences:
         """
         Load adjusted sentences from JSON file.
 
+        Parsed sentences are cached until the file changes; each call returns
+        its own copy, since the feedback agents modify sentences in place.
+
         Args:
             base_name: Base filename without extension
 
@@ -243,11 +401,8 @@ class LocalSaverService:
             FileNotFoundError: If adjusted sentences file doesn't exist
         """
         path = get_adjusted_sentences_path(base_name)
-        if not path.exists():
-            raise FileNotFoundError(f"Adjusted sentences not found: {path}")
-
-        data = json.loads(path.read_text())
-        return AdjustedSentences(**data)
+        sentences = self._load_cached(path, AdjustedSentences, "Adjusted sentences")
+        return sentences.model_copy(deep=True)
 
     def adjusted_sentences_exist(self, base_name: str) -> bool:
         """
@@ -275,10 +430,7 @@ class LocalSaverService:
             FileNotFoundError: If HTML file doesn't exist
         """
         path = get_google_doc_html_path(base_name)
-        if not path.exists():
-            raise FileNotFoundError(f"Google Doc HTML not found: {path}")
-
-        return path.read_text(encoding="utf-8")
+        return _read_file(path, "Google Doc HTML").decode("utf-8")
 
     def google_doc_html_exists(self, base_name: str) -> bool:
         """
@@ -316,7 +468,7 @@ class LocalSaverService:
             Path to saved script file
         """
         path = get_google_doc_script_path(base_name)
-        path.write_text(script.model_dump_json(indent=2))
+        _write_model(path, script)
         return path
 
     def load_google_doc_script(self, base_name: str) -> GoogleDocScript:
@@ -333,11 +485,8 @@ class LocalSaverService:
             FileNotFoundError: If script file doesn't exist
         """
         path = get_google_doc_script_path(base_name)
-        if not path.exists():
-            raise FileNotFoundError(f"Google Doc script not found: {path}")
-
-        data = json.loads(path.read_text())
-        return GoogleDocScript(**data)
+        data = _read_file(path, "Google Doc script")
+        return GoogleDocScript.model_validate_json(data)
 
     def google_doc_script_exists(self, base_name: str) -> bool:
         """
@@ -365,7 +514,7 @@ class LocalSaverService:
             Path to saved placements file
         """
         path = get_google_doc_image_placements_path(base_name)
-        path.write_text(placements.model_dump_json(indent=2))
+        _write_model(path, placements)
         return path
 
     def load_google_doc_image_placements(
@@ -384,11 +533,8 @@ class LocalSaverService:
             FileNotFoundError: If placements file doesn't exist
         """
         path = get_google_doc_image_placements_path(base_name)
-        if not path.exists():
-            raise FileNotFoundError(f"Image placements not found: {path}")
-
-        data = json.loads(path.read_text())
-        return GoogleDocImagePlacements(**data)
+        data = _read_file(path, "Image placements")
+        return GoogleDocImagePlacements.model_validate_json(data)
 
     def google_doc_image_placements_exist(self, base_name: str) -> bool:
         """
@@ -1,7 +1,8 @@
 """Speech-to-Text service implementations."""
 from src.services.stt.base import SpeechToTextService
+from src.services.stt.cached import CachedSTTService
 
-__all__ = ["SpeechToTextService"]
+__all__ = ["SpeechToTextService", "CachedSTTService"]
 
 
 
@@ -0,0 +1,100 @@
+"""
+Caching wrapper for Speech-to-Text services.
+Reuses transcripts of identical audio across runs and projects.
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+from src.services.stt.base import SpeechToTextService
+from src.services.content_cache import ContentCache
+from src.models import Transcript
+from src.util import print_progress, validate_file_exists
+
+# Number of transcripts kept in memory for reuse within one process
+STT_MEMORY_CACHE_SIZE = 64
+
+
+class CachedSTTService(SpeechToTextService):
+    """
+    Speech-to-Text service that caches another service's transcripts.
+
+    Transcripts are keyed by a SHA-256 digest of the audio bytes, so renamed
+    or re-imported recordings hit the cache too. Lookups go through a small
+    in-memory LRU first, then the on-disk content cache, and only create and
+    call the wrapped service on a miss (so cache hits need no API key).
+    """
+
+    def __init__(
+        self,
+        service_factory: Callable[[], SpeechToTextService],
+        cache: ContentCache | None = None,
+        memory_size: int = STT_MEMORY_CACHE_SIZE,
+    ):
+        """
+        Initialize cached STT service.
+
+        Args:
+            service_factory: Creates the STT service used on cache misses
+            cache: On-disk cache. Defaults to the "transcription" namespace.
+            memory_size: Maximum number of transcripts kept in memory
+        """
+        self.service_factory = service_factory
+        self._service: SpeechToTextService | None = None
+        self.cache = cache or ContentCache("transcription")
+        self.memory_size = memory_size
+        self._memory: OrderedDict[str, Transcript] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio_path: str | Path) -> Transcript:
+        """
+        Transcribe an audio file, reusing a cached transcript when available.
+
+        Args:
+            audio_path: Path to the audio file to transcribe
+
+        Returns:
+            Transcript object (a copy the caller may modify)
+
+        Raises:
+            FileNotFoundError: If audio file doesn't exist
+            RuntimeError: If transcription fails
+        """
+        audio_path = Path(audio_path)
+        validate_file_exists(audio_path)
+        key = ContentCache.hash_file(audio_path)
+
+        with self._lock:
+            transcript = self._memory.get(key)
+            if transcript is not None:
+                self._memory.move_to_end(key)
+
+        if transcript is None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                print_progress("Found cached transcription for this audio")
+                transcript = Transcript.model_validate_json(cached)
+            else:
+                if self._service is None:
+                    self._service = self.service_factory()
+                transcript = self._service.transcribe(audio_path)
+                self.cache.put(key, transcript.model_dump_json())
+            self._remember(key, transcript)
+
+        return transcript.model_copy(deep=True)
+
+    def _remember(self, key: str, transcript: Transcript) -> None:
+        """
+        Store a transcript in the in-memory LRU, evicting the oldest entry.
+
+        Args:
+            key: Audio content hash
+            transcript: Transcript to keep
+        """
+        with self._lock:
+            self._memory[key] = transcript
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
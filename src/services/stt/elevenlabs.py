@@ -4,15 +4,48 @@ Converts ElevenLabs API responses to internal models using the official SDK.
 """
 
 import os
+import subprocess
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any
 
+import numpy as np
 from elevenlabs.client import ElevenLabs  # type: ignore
 
 from src.services.stt.base import SpeechToTextService
 from src.models import Transcript, TranscriptSegment, WordTimestamp
-from src.constants import ENV_ELEVENLABS_API_KEY
-from src.util import validate_file_exists, prepare_transcript_for_prompt
+from src.constants import (
+    ENV_ELEVENLABS_API_KEY,
+    STT_CHUNK_SECONDS,
+    STT_SPLIT_SEARCH_SECONDS,
+    STT_MAX_CONCURRENT_REQUESTS,
+)
+from src.util import (
+    ensure_env_loaded,
+    validate_file_exists,
+    prepare_transcript_for_prompt,
+    print_progress,
+)
+
+# Window over which loudness is compared when choosing a split point
+SPLIT_WINDOW_SECONDS = 0.05
+
+
+def _get_field(obj: Any, name: str) -> Any:
+    """
+    Read a field from an SDK response model or a plain dict.
+
+    Args:
+        obj: SDK model instance or dict
+        name: Field name
+
+    Returns:
+        Field value, or None if absent
+    """
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
 
 
 class ElevenLabsSTTService(SpeechToTextService):
@@ -31,6 +64,8 @@ class ElevenLabsSTTService(SpeechToTextService):
         Raises:
             ValueError: If API key is not provided or found in environment
         """
+        if not api_key:
+            ensure_env_loaded()
         self.api_key = api_key or os.getenv(ENV_ELEVENLABS_API_KEY)
         if not self.api_key:
             raise ValueError(
@@ -45,6 +80,9 @@ class ElevenLabsSTTService(SpeechToTextService):
         """
         Transcribe audio using ElevenLabs STT API via official SDK.
 
+        Long recordings are split at pauses into chunks of about
+        STT_CHUNK_SECONDS, which are transcribed concurrently and merged.
+
         Args:
             audio_path: Path to audio file
 
@@ -59,18 +97,11 @@ class ElevenLabsSTTService(SpeechToTextService):
         validate_file_exists(audio_path)
 
         try:
-            # Open audio file and call ElevenLabs API using SDK
-            with open(audio_path, "rb") as audio_file:
-                transcription = self.client.speech_to_text.convert(
-                    file=audio_file,
-                    model_id="scribe_v1",  # Using scribe_v1 as per example
-                    tag_audio_events=True,  # Tag audio events like laughter, applause
-                    language_code="eng",  # Can be made configurable
-                    diarize=True,  # Annotate who is speaking
-                )
-
-            # Convert SDK response to internal model
-            transcript = self._convert_response(transcription)
+            split_points = self._find_split_points(audio_path)
+            if split_points:
+                transcript = self._transcribe_chunks(audio_path, split_points)
+            else:
+                transcript = self._transcribe_range(audio_path)
 
             # Generate sentences from segments
             sentences = prepare_transcript_for_prompt(transcript)
@@ -81,6 +112,192 @@ class ElevenLabsSTTService(SpeechToTextService):
         except Exception as e:
             raise RuntimeError(f"ElevenLabs transcription failed: {str(e)}") from e
 
+    def _transcribe_range(
+        self, audio_path: Path, start: float = 0.0, end: float | None = None
+    ) -> Transcript:
+        """
+        Transcribe part of an audio file with a single API request.
+
+        Args:
+            audio_path: Path to audio file
+            start: Start of the range in seconds
+            end: End of the range in seconds, or None for the end of the file
+
+        Returns:
+            Transcript with timestamps relative to start
+        """
+        # Upload a lossless FLAC encoded in memory rather than the raw WAV
+        transcription = self.client.speech_to_text.convert(
+            file=(
+                f"{audio_path.stem}.flac",
+                self._encode_flac(audio_path, start, end),
+                "audio/flac",
+            ),
+            model_id="scribe_v1",  # Using scribe_v1 as per example
+            tag_audio_events=True,  # Tag audio events like laughter, applause
+            language_code="eng",  # Can be made configurable
+            diarize=True,  # Annotate who is speaking
+        )
+
+        # Convert SDK response to internal model
+        return self._convert_response(transcription)
+
+    def _find_split_points(self, audio_path: Path) -> list[float]:
+        """
+        Choose chunk boundaries for a long recording.
+
+        Each boundary is placed at the quietest moment within
+        STT_SPLIT_SEARCH_SECONDS of the next multiple of STT_CHUNK_SECONDS, so
+        chunks are cut in pauses rather than mid-word.
+
+        Args:
+            audio_path: Path to audio file (16-bit PCM WAV from step 2)
+
+        Returns:
+            Split times in seconds, or an empty list if the audio should be
+            sent as one request (short, or not a 16-bit WAV)
+        """
+        try:
+            with wave.open(str(audio_path), "rb") as wav:
+                sample_rate = wav.getframerate()
+                channels = wav.getnchannels()
+                sample_width = wav.getsampwidth()
+                if wav.getnframes() <= STT_CHUNK_SECONDS * sample_rate:
+                    return []
+                frames = wav.readframes(wav.getnframes())
+        except (wave.Error, EOFError):
+            return []
+        if sample_width != 2:
+            return []
+
+        samples = np.frombuffer(frames, dtype=np.int16)[::channels]
+        duration = len(samples) / sample_rate
+        window = max(int(SPLIT_WINDOW_SECONDS * sample_rate), 1)
+        search = int(STT_SPLIT_SEARCH_SECONDS * sample_rate)
+
+        split_points: list[float] = []
+        target = float(STT_CHUNK_SECONDS)
+        while target + STT_SPLIT_SEARCH_SECONDS < duration:
+            center = int(target * sample_rate)
+            lo = max(center - search, 0)
+            region = samples[lo : center + search].astype(np.float32)
+            num_windows = len(region) // window
+            energy = np.square(region[: num_windows * window])
+            energy = energy.reshape(num_windows, window).mean(axis=1)
+            quietest = lo + int(np.argmin(energy)) * window + window // 2
+            split = quietest / sample_rate
+            split_points.append(split)
+            target = split + STT_CHUNK_SECONDS
+
+        return split_points
+
+    def _transcribe_chunks(
+        self, audio_path: Path, split_points: list[float]
+    ) -> Transcript:
+        """
+        Transcribe chunks of an audio file concurrently and merge the results.
+
+        Args:
+            audio_path: Path to audio file
+            split_points: Chunk boundaries in seconds
+
+        Returns:
+            Transcript covering the whole file
+        """
+        starts = [0.0, *split_points]
+        ends: list[float | None] = [*split_points, None]
+        print_progress(
+            f"Transcribing {len(starts)} chunks "
+            f"({STT_MAX_CONCURRENT_REQUESTS} at a time)"
+        )
+
+        with ThreadPoolExecutor(max_workers=STT_MAX_CONCURRENT_REQUESTS) as executor:
+            parts = list(
+                executor.map(
+                    lambda start, end: self._transcribe_range(audio_path, start, end),
+                    starts,
+                    ends,
+                )
+            )
+
+        return self._merge_transcripts(parts, starts)
+
+    def _merge_transcripts(
+        self, parts: list[Transcript], offsets: list[float]
+    ) -> Transcript:
+        """
+        Merge chunk transcripts into one, shifting times by chunk offset.
+
+        Segments are kept as returned for each chunk, so chunk boundaries stay
+        segment boundaries.
+
+        Args:
+            parts: Transcripts of consecutive chunks
+            offsets: Start time of each chunk in seconds
+
+        Returns:
+            Transcript for the whole recording
+        """
+        segments = [
+            TranscriptSegment(
+                text=segment.text,
+                start=segment.start + offset,
+                end=segment.end + offset,
+                words=[
+                    WordTimestamp(
+                        word=w.word, start=w.start + offset, end=w.end + offset
+                    )
+                    for w in segment.words
+                ],
+            )
+            for part, offset in zip(parts, offsets)
+            for segment in part.segments
+        ]
+        language = next((part.language for part in parts if part.language), None)
+
+        words = [w for segment in segments for w in segment.words]
+        duration = words[-1].end if words else None
+        return Transcript(segments=segments, language=language, duration=duration)
+
+    def _encode_flac(
+        self, audio_path: Path, start: float = 0.0, end: float | None = None
+    ) -> bytes:
+        """
+        Encode an audio file to FLAC in memory by piping it through ffmpeg.
+
+        FLAC is lossless, so the transcript is unaffected, but the upload is
+        roughly half the size of the 16-bit PCM WAV kept on disk for step 5.
+
+        Args:
+            audio_path: Path to audio file
+            start: Start of the range to encode in seconds
+            end: End of the range in seconds, or None for the end of the file
+
+        Returns:
+            FLAC-encoded audio bytes
+
+        Raises:
+            RuntimeError: If ffmpeg fails
+        """
+        cmd = ["ffmpeg", "-i", str(audio_path)]
+        if start:
+            cmd += ["-ss", f"{start:.3f}"]
+        if end is not None:
+            cmd += ["-to", f"{end:.3f}"]
+        cmd += ["-f", "flac", "-"]
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(
+                f"ffmpeg FLAC encoding failed:\n"
+                f"Command: {' '.join(cmd)}\n"
+                f"Exit code: {e.returncode}\n"
+                f"stderr: {e.stderr.decode(errors='replace')}"
+            ) from e
+
+        return result.stdout
+
     def _convert_response(self, response: Any) -> Transcript:
         """
         Convert ElevenLabs SDK response to internal Transcript model.
@@ -97,29 +314,22 @@ class ElevenLabsSTTService(SpeechToTextService):
         """
         segments = []
 
-        # Convert response to dict if it's a Pydantic model
-        if hasattr(response, "model_dump"):
-            response_dict = response.model_dump()
-        elif hasattr(response, "dict"):
-            response_dict = response.dict()
-        else:
-            response_dict = response
-
-        # Handle multichannel response
-        if "transcripts" in response_dict:
+        # Fields are read straight off the SDK model; dumping it to a dict first
+        # would copy every word (and its character-level details) a second time
+        transcripts = _get_field(response, "transcripts")
+        if transcripts is not None:
             # MultichannelSpeechToTextResponseModel
-            transcripts = response_dict.get("transcripts", [])
             # For now, just use the first channel
             if transcripts:
-                response_dict = transcripts[0]
+                response = transcripts[0]
             else:
                 # No transcripts available
                 return Transcript(segments=[], language=None, duration=None)
 
         # Handle single channel response (SpeechToTextChunkResponseModel)
-        full_text = response_dict.get("text", "")
-        language_code = response_dict.get("language_code")
-        words_data = response_dict.get("words", [])
+        full_text = _get_field(response, "text") or ""
+        language_code = _get_field(response, "language_code")
+        words_data = _get_field(response, "words") or []
 
         # Convert words to internal format
         words = self._extract_words_from_api(words_data)
@@ -142,9 +352,7 @@ class ElevenLabsSTTService(SpeechToTextService):
 
         return Transcript(segments=segments, language=language_code, duration=duration)
 
-    def _extract_words_from_api(
-        self, words_data: list[Dict[str, Any]]
-    ) -> list[WordTimestamp]:
+    def _extract_words_from_api(self, words_data: list[Any]) -> list[WordTimestamp]:
         """
         Extract word-level timestamps from API words array.
 
@@ -158,7 +366,7 @@ class ElevenLabsSTTService(SpeechToTextService):
         - characters: array | null (character-level details)
 
         Args:
-            words_data: List of word objects from API
+            words_data: List of word objects (SDK models or dicts) from API
 
         Returns:
             List of WordTimestamp objects
@@ -166,21 +374,15 @@ class ElevenLabsSTTService(SpeechToTextService):
         words: list[WordTimestamp] = []
 
         for word_obj in words_data:
-            # Convert to dict if it's a Pydantic model
-            if hasattr(word_obj, "model_dump"):
-                word_obj = word_obj.model_dump()
-            elif hasattr(word_obj, "dict"):
-                word_obj = word_obj.dict()
-
-            word_type = word_obj.get("type", "word")
+            word_type = _get_field(word_obj, "type") or "word"
 
             # Only process actual words, skip spacing and audio events
             if word_type != "word":
                 continue
 
-            text = word_obj.get("text", "")
-            start = word_obj.get("start")
-            end = word_obj.get("end")
+            text = _get_field(word_obj, "text") or ""
+            start = _get_field(word_obj, "start")
+            end = _get_field(word_obj, "end")
 
             # Skip if no timing information
             if start is None or end is None:
@@ -3,6 +3,7 @@ Utility functions for MLT XML generation.
 Independent helper functions that don't require class state.
 """
 
+import os
 import subprocess
 import json
 from pathlib import Path
@@ -10,6 +11,13 @@ from xml.etree import ElementTree as ET
 from xml.dom import minidom
 from datetime import datetime
 import hashlib
+from functools import lru_cache
+
+# Decoder threads for the source video; the other half of the cores is left
+# to the encoder (see RENDER_THREADS in mlt_video_service). For AVCHD sources,
+# skip_loop_filter=all would speed decoding further at some quality cost, so
+# it is not set here.
+DECODE_THREADS = max(1, (os.cpu_count() or 2) // 2)
 
 
 def frames_to_timecode(frames: int, fps: float) -> str:
@@ -35,9 +43,30 @@ def get_video_properties(video_path: Path) -> dict:
     """
     Get video properties (resolution, framerate) using ffprobe.
 
+    Results are cached per file version (path, mtime, size), so steps that
+    render from the same source only probe it once per process.
+
     Args:
         video_path: Path to video file
 
+    Returns:
+        Dictionary with width, height, fps, frame_rate_num, frame_rate_den
+    """
+    stat = Path(video_path).stat()
+    props = _probe_video_properties(str(video_path), stat.st_mtime_ns, stat.st_size)
+    return dict(props)
+
+
+@lru_cache(maxsize=32)
+def _probe_video_properties(video_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Run ffprobe for get_video_properties.
+
+    Args:
+        video_path: Path to video file
+        mtime_ns: File modification time (part of the cache key only)
+        size: File size in bytes (part of the cache key only)
+
     Returns:
         Dictionary with width, height, fps, frame_rate_num, frame_rate_den
     """
@@ -240,6 +269,9 @@ def add_video_chain(root: ET.Element, video_path: Path, total_timecode: str) ->
     mute_prop = ET.SubElement(chain, "property", {"name": "mute_on_pause"})
     mute_prop.text = "0"
 
+    threads_prop = ET.SubElement(chain, "property", {"name": "threads"})
+    threads_prop.text = str(DECODE_THREADS)
+
     # Add creation time (current time in ISO format)
     creation_time = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
     creation_time_prop = ET.SubElement(chain, "property", {"name": "creation_time"})
@@ -3,7 +3,9 @@ MLT-based video editing service.
 Uses MLT XML files and the melt command-line tool for video processing.
 """
 
-import subprocess
+import hashlib
+import os
+from datetime import datetime
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
@@ -21,8 +23,14 @@ from src.util import (
     get_full_res_with_images_mlt_path,
     get_input_video_path,
     print_progress,
+    print_command,
+    run_streaming_command,
+    compute_render_hash,
+    render_is_current,
+    record_render_hash,
 )
 from src.constants import (
+    ASSETS_DIR,
     IMAGE_SAFE_ZONE_TOP_PERCENT,
     IMAGE_SAFE_ZONE_BOTTOM_PERCENT,
     IMAGE_SAFE_ZONE_LEFT_PERCENT,
@@ -42,8 +50,14 @@ from src.services.video.mlt_util import (
     add_mix_transition,
     add_composite_transition,
     add_cairo_transition,
+    get_video_rotation,
+    create_rotation_mlt_xml,
 )
 
+# Frame-preparation threads for melt renders. A negative real_time value makes
+# the consumer use that many threads without dropping frames.
+RENDER_THREADS = os.cpu_count() or 1
+
 
 class MLTVideoService:
     """
@@ -73,12 +87,6 @@ class MLTVideoService:
             FileNotFoundError: If source video doesn't exist
             RuntimeError: If melt command fails
         """
-        from src.constants import ASSETS_DIR
-        from src.services.video.mlt_util import (
-            get_video_rotation,
-            create_rotation_mlt_xml,
-        )
-
         # Look for source video files in order of preference
         folder = ASSETS_DIR / base_name
         source_path = None
@@ -156,11 +164,12 @@ class MLTVideoService:
             "preset=faster",
             "acodec=aac",
             "pix_fmt=yuv420p",
+            f"real_time=-{RENDER_THREADS}",
         ]
 
-        print_progress(f"Command: {' '.join(cmd)}")
+        print_command(cmd)
 
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        run_streaming_command(cmd)
 
         print_progress(f"Rotated video created: {output_path.name}")
         print_progress(f"MLT XML saved for debugging: {mlt_xml_path.name}")
@@ -567,12 +576,13 @@ class MLTVideoService:
             "crf=18",
             "preset=medium",
             "pix_fmt=yuv420p",
+            f"real_time=-{RENDER_THREADS}",
         ]
 
         print_progress("Running melt command...")
-        print_progress(f"Command: {' '.join(cmd)}")
+        print_command(cmd)
 
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        run_streaming_command(cmd)
 
         print_progress(f"Video with images created: {output_path}")
         print_progress(f"MLT XML saved for debugging: {mlt_xml_path}")
@@ -734,12 +744,13 @@ class MLTVideoService:
             "crf=18",
             "preset=medium",
             "pix_fmt=yuv420p",
+            f"real_time=-{RENDER_THREADS}",
         ]
 
         print_progress("Running melt command...")
-        print_progress(f"Command: {' '.join(cmd)}")
+        print_command(cmd)
 
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        run_streaming_command(cmd)
 
         print_progress(f"Video with Google Doc images created: {output_path}")
         print_progress(f"MLT XML saved for debugging: {mlt_xml_path}")
@@ -814,13 +825,9 @@ class MLTVideoService:
             ET.SubElement(chain, "property", {"name": "mute_on_pause"}).text = "0"
 
             # Add hash and creation time
-            import hashlib
-
             file_hash = hashlib.md5(f"{video_path}_{i}".encode()).hexdigest()
             ET.SubElement(chain, "property", {"name": "shotcut:hash"}).text = file_hash
 
-            from datetime import datetime
-
             creation_time = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
             ET.SubElement(
                 chain, "property", {"name": "creation_time"}
@@ -880,11 +887,39 @@ class MLTVideoService:
 
         print_progress(f"Created MLT XML file for cutting: {output_mlt_path}")
 
+    def _images_render_hash(
+        self,
+        input_path: Path,
+        adjusted_sentences: AdjustedSentences,
+        image_placements: GoogleDocImagePlacements,
+        cmd: list[str],
+    ) -> str:
+        """
+        Hash the inputs of a render with image overlays.
+
+        Args:
+            input_path: Video being cut or overlaid
+            adjusted_sentences: AdjustedSentences with timestamps
+            image_placements: Google Doc image placements
+            cmd: melt command (covers encoder settings)
+
+        Returns:
+            Hex digest string
+        """
+        image_paths = [Path(p.filepath) for p in image_placements.placements]
+        return compute_render_hash(
+            [input_path, *image_paths],
+            adjusted_sentences.model_dump_json(),
+            image_placements.model_dump_json(),
+            *cmd,
+        )
+
     def create_full_res_cut_video(
         self,
         base_name: str,
         adjusted_sentences: AdjustedSentences,
         force: bool = False,
+        skip_if_current: bool = False,
     ) -> Path:
         """
         Create full resolution cut video using MLT XML and melt command.
@@ -894,6 +929,8 @@ class MLTVideoService:
             base_name: Base filename without extension
             adjusted_sentences: AdjustedSentences with timestamps
             force: If True, regenerate even if file exists
+            skip_if_current: If True, reuse an existing file only when it was
+                rendered from the current inputs, and re-render it otherwise
 
         Returns:
             Path to full resolution cut video file
@@ -911,36 +948,55 @@ class MLTVideoService:
                 f"Original video not found: {input_path}. Cannot create full resolution cut."
             )
 
-        if output_path.exists() and not force:
+        if output_path.exists() and not force and not skip_if_current:
             print_progress(f"Full resolution cut video already exists: {output_path}")
             return output_path
 
-        print_progress(f"Creating full resolution cut video from: {input_path.name}...")
-        print_progress(f"Cutting {len(adjusted_sentences.sentences)} segments")
-
-        # Create MLT XML file (saved for debugging)
-        self._create_mlt_xml_for_cutting(
-            input_path,
-            adjusted_sentences,
-            mlt_xml_path,
+        # Render to a temporary name so the cut only appears once it is complete
+        # (step 13 may be checking for it concurrently)
+        partial_path = output_path.with_name(
+            f"{output_path.stem}.partial{output_path.suffix}"
         )
-
         cmd = [
             "melt",
             str(mlt_xml_path),
             "-consumer",
-            f"avformat:{output_path}",
+            f"avformat:{partial_path}",
             "vcodec=libx264",
             "acodec=aac",
             "crf=18",
             "preset=medium",
             "pix_fmt=yuv420p",
+            f"real_time=-{RENDER_THREADS}",
         ]
 
+        render_hash = compute_render_hash(
+            [input_path], adjusted_sentences.model_dump_json(), *cmd
+        )
+        if (
+            skip_if_current
+            and not force
+            and render_is_current(output_path, render_hash)
+        ):
+            print_progress("Inputs unchanged since the last render, skipping")
+            return output_path
+
+        print_progress(f"Creating full resolution cut video from: {input_path.name}...")
+        print_progress(f"Cutting {len(adjusted_sentences.sentences)} segments")
+
+        # Create MLT XML file (saved for debugging)
+        self._create_mlt_xml_for_cutting(
+            input_path,
+            adjusted_sentences,
+            mlt_xml_path,
+        )
+
         print_progress("Running melt command...")
-        print_progress(f"Command: {' '.join(cmd)}")
+        print_command(cmd)
 
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        run_streaming_command(cmd)
+        partial_path.replace(output_path)
+        record_render_hash(output_path, render_hash)
 
         print_progress(f"Full resolution cut video created: {output_path}")
         print_progress(f"MLT XML saved for debugging: {mlt_xml_path}")
@@ -1017,13 +1073,9 @@ class MLTVideoService:
             ET.SubElement(chain, "property", {"name": "mute_on_pause"}).text = "0"
 
             # Add hash and creation time
-            import hashlib
-
             file_hash = hashlib.md5(f"{video_path}_{i}".encode()).hexdigest()
             ET.SubElement(chain, "property", {"name": "shotcut:hash"}).text = file_hash
 
-            from datetime import datetime
-
             creation_time = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
             ET.SubElement(
                 chain, "property", {"name": "creation_time"}
@@ -1134,6 +1186,7 @@ class MLTVideoService:
         adjusted_sentences: AdjustedSentences,
         image_placements: GoogleDocImagePlacements,
         force: bool = False,
+        skip_if_current: bool = False,
     ) -> Path:
         """
         Create full resolution video with cuts AND image overlays in a single MLT pass.
@@ -1144,6 +1197,8 @@ class MLTVideoService:
             adjusted_sentences: AdjustedSentences with timestamps
             image_placements: Google Doc image placements with sentence associations
             force: If True, regenerate even if file exists
+            skip_if_current: If True, reuse an existing file only when it was
+                rendered from the current inputs, and re-render it otherwise
 
         Returns:
             Path to full resolution video file with cuts and images
@@ -1161,16 +1216,12 @@ class MLTVideoService:
                 f"Original video not found: {input_path}. Cannot create full resolution video."
             )
 
-        if output_path.exists() and not force:
+        if output_path.exists() and not force and not skip_if_current:
             print_progress(
                 f"Full resolution video with cuts and images already exists: {output_path}"
             )
             return output_path
 
-        print_progress(f"Creating full resolution video from: {input_path.name}...")
-        print_progress(f"Cutting {len(adjusted_sentences.sentences)} segments")
-        print_progress(f"Adding {len(image_placements.placements)} image overlays")
-
         # Verify all image files exist
         missing_images = []
         for placement in image_placements.placements:
@@ -1184,30 +1235,53 @@ class MLTVideoService:
                 + "\n".join(f"  - {img}" for img in missing_images)
             )
 
-        # Create MLT XML file for cutting with images in one pass
-        self._create_mlt_xml_for_cutting_with_images(
-            input_path,
-            adjusted_sentences,
-            image_placements,
-            mlt_xml_path,
+        # Render to a temporary name so a half-written file never looks like
+        # a finished render
+        partial_path = output_path.with_name(
+            f"{output_path.stem}.partial{output_path.suffix}"
         )
-
         cmd = [
             "melt",
             str(mlt_xml_path),
             "-consumer",
-            f"avformat:{output_path}",
+            f"avformat:{partial_path}",
             "vcodec=libx264",
             "acodec=aac",
             "crf=18",
             "preset=medium",
             "pix_fmt=yuv420p",
+            f"real_time=-{RENDER_THREADS}",
         ]
 
+        render_hash = self._images_render_hash(
+            input_path, adjusted_sentences, image_placements, cmd
+        )
+        if (
+            skip_if_current
+            and not force
+            and render_is_current(output_path, render_hash)
+        ):
+            print_progress("Inputs unchanged since the last render, skipping")
+            return output_path
+
+        print_progress(f"Creating full resolution video from: {input_path.name}...")
+        print_progress(f"Cutting {len(adjusted_sentences.sentences)} segments")
+        print_progress(f"Adding {len(image_placements.placements)} image overlays")
+
+        # Create MLT XML file for cutting with images in one pass
+        self._create_mlt_xml_for_cutting_with_images(
+            input_path,
+            adjusted_sentences,
+            image_placements,
+            mlt_xml_path,
+        )
+
         print_progress("Running melt command (single pass - cutting + images)...")
-        print_progress(f"Command: {' '.join(cmd)}")
+        print_command(cmd)
 
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        run_streaming_command(cmd)
+        partial_path.replace(output_path)
+        record_render_hash(output_path, render_hash)
 
         print_progress(
             f"Full resolution video with cuts and images created: {output_path}"
@@ -1221,6 +1295,7 @@ class MLTVideoService:
         adjusted_sentences: AdjustedSentences,
         image_placements: GoogleDocImagePlacements,
         force: bool = False,
+        skip_if_current: bool = False,
     ) -> Path:
         """
         Create full resolution video with Google Doc image overlays using MLT XML and melt command.
@@ -1232,6 +1307,8 @@ class MLTVideoService:
             adjusted_sentences: AdjustedSentences with timestamps
             image_placements: Google Doc image placements with sentence associations
             force: If True, regenerate even if file exists
+            skip_if_current: If True, reuse an existing file only when it was
+                rendered from the current inputs, and re-render it otherwise
 
         Returns:
             Path to full resolution video file with Google Doc images
@@ -1250,17 +1327,12 @@ class MLTVideoService:
                 f"Full resolution cut video not found: {input_path}. Please run Stage 11 first."
             )
 
-        if output_path.exists() and not force:
+        if output_path.exists() and not force and not skip_if_current:
             print_progress(
                 f"Full resolution video with Google Doc images already exists: {output_path}"
             )
             return output_path
 
-        print_progress(
-            f"Creating full resolution video with Google Doc images from: {input_path.name}..."
-        )
-        print_progress(f"Adding {len(image_placements.placements)} image overlays")
-
         # Verify all image files exist
         missing_images = []
         for placement in image_placements.placements:
@@ -1274,30 +1346,54 @@ class MLTVideoService:
                 + "\n".join(f"  - {img}" for img in missing_images)
             )
 
-        # Create MLT XML file (saved for debugging)
-        self._create_mlt_xml_with_google_doc_images(
-            input_path,
-            adjusted_sentences,
-            image_placements,
-            mlt_xml_path,
+        # Render to a temporary name so a half-written file never looks like
+        # a finished render
+        partial_path = output_path.with_name(
+            f"{output_path.stem}.partial{output_path.suffix}"
         )
-
         cmd = [
             "melt",
             str(mlt_xml_path),
             "-consumer",
-            f"avformat:{output_path}",
+            f"avformat:{partial_path}",
             "vcodec=libx264",
             "acodec=aac",
             "crf=18",
             "preset=medium",
             "pix_fmt=yuv420p",
+            f"real_time=-{RENDER_THREADS}",
         ]
 
+        render_hash = self._images_render_hash(
+            input_path, adjusted_sentences, image_placements, cmd
+        )
+        if (
+            skip_if_current
+            and not force
+            and render_is_current(output_path, render_hash)
+        ):
+            print_progress("Inputs unchanged since the last render, skipping")
+            return output_path
+
+        print_progress(
+            f"Creating full resolution video with Google Doc images from: {input_path.name}..."
+        )
+        print_progress(f"Adding {len(image_placements.placements)} image overlays")
+
+        # Create MLT XML file (saved for debugging)
+        self._create_mlt_xml_with_google_doc_images(
+            input_path,
+            adjusted_sentences,
+            image_placements,
+            mlt_xml_path,
+        )
+
         print_progress("Running melt command...")
-        print_progress(f"Command: {' '.join(cmd)}")
+        print_command(cmd)
 
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        run_streaming_command(cmd)
+        partial_path.replace(output_path)
+        record_render_hash(output_path, render_hash)
 
         print_progress(
             f"Full resolution video with Google Doc images created: {output_path}"
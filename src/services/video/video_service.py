@@ -3,8 +3,10 @@ Video processing service for generating proxy assets.
 Handles low-res video generation and audio extraction using ffmpeg.
 """
 
+import json
 import subprocess
 import os
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -22,7 +24,10 @@ from src.constants import (
     AUDIO_CHANNELS,
     VIDEO_CODEC,
     VIDEO_PRESET,
+    PROXY_HW_ENCODERS,
+    PROXY_HW_BITRATE,
     AUDIO_CODEC,
+    AUDIO_EXTRACT_THREADS,
 )
 from src.util import (
     extract_filename_without_extension,
@@ -34,6 +39,9 @@ from src.util import (
     get_edited_video_path,
     prepare_transcript_for_prompt,
     get_input_video_path,
+    compute_render_hash,
+    render_is_current,
+    record_render_hash,
 )
 from src.models import (
     Transcript,
@@ -51,6 +59,57 @@ SILENCE_THRESHOLD_OFFSET_DB = (
 SILENCE_PADDING = 0.02  # Seconds to pad before/after detected speech
 CLIP_DB_DIFFERENCE_THRESHOLD = 5  # If clip's speech level differs from video by more than this (dB), use video-level threshold
 
+# RMS envelope analysis settings
+ANALYSIS_SAMPLE_RATE = 22050
+RMS_FRAME_LENGTH = 512  # ~23ms at 22050 Hz
+RMS_HOP_LENGTH = 256  # 50% overlap
+
+# moviepy write_videofile options for the edited preview (part of its render hash)
+EDITED_VIDEO_WRITE_OPTIONS = {"codec": "libx264", "audio_codec": "aac"}
+
+
+@lru_cache(maxsize=1)
+def _available_ffmpeg_encoders() -> frozenset[str]:
+    """
+    List the encoders compiled into the local ffmpeg (queried once).
+
+    Returns:
+        Encoder names, or an empty set if ffmpeg can't be queried
+    """
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+
+    encoders = set()
+    listing = result.stdout.split("------", 1)[-1]
+    for line in listing.splitlines():
+        fields = line.split()
+        if len(fields) >= 2:
+            encoders.add(fields[1])
+    return frozenset(encoders)
+
+
+def _proxy_codec_args(encoder: str) -> list[str]:
+    """
+    Build the video codec arguments for a proxy encode.
+
+    Args:
+        encoder: ffmpeg encoder name
+
+    Returns:
+        ffmpeg arguments selecting the encoder and its quality settings
+    """
+    if encoder == VIDEO_CODEC:
+        # Higher CRF = lower quality/size
+        return ["-c:v", VIDEO_CODEC, "-preset", VIDEO_PRESET, "-crf", "28"]
+    return ["-c:v", encoder, "-b:v", PROXY_HW_BITRATE]
+
 
 class VideoService:
     """
@@ -68,6 +127,8 @@ class VideoService:
         self.assets_dir = Path(assets_dir) if assets_dir else ASSETS_DIR
         ensure_directory_exists(self.assets_dir)
         self._video_level_threshold_cache = {}  # Cache for video-level thresholds
+        # Whole-file RMS envelopes: path -> ((mtime_ns, size), envelope)
+        self._rms_envelope_cache = {}
 
     def generate_proxy_video(
         self, input_path: str | Path, height: int = LOW_RES_HEIGHT, force: bool = False
@@ -101,39 +162,44 @@ class VideoService:
 
         print_progress(f"Generating {height}p proxy video...")
 
-        # Build ffmpeg command
-        cmd = [
-            "ffmpeg",
-            "-i",
-            str(input_path),
-            "-vf",
-            f"scale=-2:{height}",  # -2 ensures width is divisible by 2
-            "-c:v",
-            VIDEO_CODEC,
-            "-preset",
-            VIDEO_PRESET,
-            "-crf",
-            "28",  # Higher CRF = lower quality/size
-            "-c:a",
-            "aac",
-            "-b:a",
-            "128k",
-            "-y",  # Overwrite output file
-            str(output_path),
-        ]
-
-        try:
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
-            print_progress(f"Proxy video created: {output_path}")
-            return output_path
-
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(
-                f"ffmpeg proxy generation failed:\n"
-                f"Command: {' '.join(cmd)}\n"
-                f"Exit code: {e.returncode}\n"
-                f"stderr: {e.stderr}"
-            ) from e
+        # Prefer a hardware encoder when ffmpeg has one; an encoder can be
+        # compiled in without usable hardware, so fall back on failure
+        available = _available_ffmpeg_encoders()
+        encoders = [enc for enc in PROXY_HW_ENCODERS if enc in available]
+        encoders.append(VIDEO_CODEC)
+
+        for encoder in encoders:
+            # Build ffmpeg command
+            cmd = [
+                "ffmpeg",
+                "-i",
+                str(input_path),
+                "-vf",
+                f"scale=-2:{height}",  # -2 ensures width is divisible by 2
+                *_proxy_codec_args(encoder),
+                "-c:a",
+                "aac",
+                "-b:a",
+                "128k",
+                "-y",  # Overwrite output file
+                str(output_path),
+            ]
+
+            try:
+                subprocess.run(cmd, capture_output=True, text=True, check=True)
+                print_progress(f"Proxy video created with {encoder}: {output_path}")
+                return output_path
+
+            except subprocess.CalledProcessError as e:
+                if encoder != VIDEO_CODEC:
+                    print_progress(f"{encoder} encode failed, trying next encoder")
+                    continue
+                raise RuntimeError(
+                    f"ffmpeg proxy generation failed:\n"
+                    f"Command: {' '.join(cmd)}\n"
+                    f"Exit code: {e.returncode}\n"
+                    f"stderr: {e.stderr}"
+                ) from e
 
     def extract_audio(
         self,
@@ -184,6 +250,8 @@ class VideoService:
             str(sample_rate),
             "-ac",
             str(channels),
+            "-threads",
+            str(AUDIO_EXTRACT_THREADS),
             "-y",  # Overwrite output file
             str(output_path),
         ]
@@ -263,9 +331,6 @@ class VideoService:
 
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-
-            import json
-
             return json.loads(result.stdout)
 
         except subprocess.CalledProcessError as e:
@@ -275,6 +340,52 @@ class VideoService:
         except json.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse ffprobe output: {str(e)}") from e
 
+    def _get_rms_envelope(self, audio_path: Path) -> np.ndarray:
+        """
+        Compute the RMS energy envelope of the entire audio file.
+
+        The file is decoded and analyzed once; per-sentence analysis slices this
+        array instead of re-loading and re-resampling each sentence's audio.
+        Cached per audio file, and recomputed when the file changes.
+
+        Args:
+            audio_path: Path to the extracted audio file
+
+        Returns:
+            1-D array of RMS values, one per frame of RMS_HOP_LENGTH samples
+        """
+        cache_key = str(audio_path)
+        stat = Path(audio_path).stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        entry = self._rms_envelope_cache.get(cache_key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        # Load entire audio file
+        audio_array, _ = librosa.load(
+            str(audio_path), sr=ANALYSIS_SAMPLE_RATE, mono=True
+        )
+
+        rms = librosa.feature.rms(
+            y=audio_array, frame_length=RMS_FRAME_LENGTH, hop_length=RMS_HOP_LENGTH
+        )[0]
+
+        self._rms_envelope_cache[cache_key] = (version, rms)
+        return rms
+
+    def warm_silence_analysis(self, audio_path: str | Path) -> None:
+        """
+        Precompute and cache the audio analysis used for silence trimming.
+
+        Lets callers do the decode and RMS pass ahead of time (e.g. while
+        waiting on the transcription API) so generate_adjusted_sentences
+        starts from cached values.
+
+        Args:
+            audio_path: Path to the extracted audio file
+        """
+        self._get_video_level_speech_threshold(Path(audio_path))
+
     def _get_video_level_speech_threshold(self, audio_path: Path) -> float:
         """
         Calculate the video-level speech threshold by analyzing the entire audio file.
@@ -286,23 +397,16 @@ class VideoService:
         Returns:
             The silence threshold in dB for the entire video
         """
-        # Check cache first
-        cache_key = str(audio_path)
+        # Check cache first (keyed like the RMS envelope it is derived from)
+        stat = Path(audio_path).stat()
+        cache_key = (str(audio_path), stat.st_mtime_ns, stat.st_size)
         if cache_key in self._video_level_threshold_cache:
             return self._video_level_threshold_cache[cache_key]
 
         print_progress("Calculating video-level speech threshold...")
 
-        # Load entire audio file
-        audio_array, sr = librosa.load(str(audio_path), sr=22050, mono=True)
-
-        # Calculate RMS energy for entire file
-        frame_length = 512
-        hop_length = 256
-
-        rms = librosa.feature.rms(
-            y=audio_array, frame_length=frame_length, hop_length=hop_length
-        )[0]
+        # RMS energy for entire file
+        rms = self._get_rms_envelope(audio_path)
 
         # Convert to dB
         rms_db = librosa.amplitude_to_db(rms, ref=np.max)
@@ -332,31 +436,23 @@ class VideoService:
 
         Args:
             audio_path: Path to the extracted audio file
-            start: Start time of segment in original video (seconds)
-            end: End time of segment in original video (seconds)
-            sentence_index: Optional sentence index for debugging (1-based)
+            sentence: Sentence whose time range should be trimmed
+            sentence_index: Sentence index for debugging (1-based)
 
         Returns:
-            Tuple of (adjusted_start, adjusted_end) in seconds relative to original video
+            AdjustedSentence with timestamps relative to original video
         """
         start = sentence.start
         end = sentence.end
-        # Load only the specific time segment directly with librosa from the audio file
-        audio_array, sr = librosa.load(
-            str(audio_path),
-            sr=22050,
-            mono=True,
-            offset=start,
-            duration=end - start,
-        )
+        sr = ANALYSIS_SAMPLE_RATE
+        hop_length = RMS_HOP_LENGTH
 
-        # Calculate RMS (Root Mean Square) energy per frame
-        frame_length = 512  # ~23ms at 22050 Hz
-        hop_length = 256  # 50% overlap
-
-        rms = librosa.feature.rms(
-            y=audio_array, frame_length=frame_length, hop_length=hop_length
-        )[0]
+        # Slice this sentence's frames out of the whole-file RMS envelope
+        envelope = self._get_rms_envelope(audio_path)
+        first_frame = min(int(round(start * sr / hop_length)), len(envelope) - 1)
+        num_frames = 1 + int((end - start) * sr) // hop_length
+        rms = envelope[first_frame : first_frame + num_frames]
+        frame_start_time = (first_frame * hop_length) / sr
 
         # Convert to dB
         rms_db = librosa.amplitude_to_db(rms, ref=np.max)
@@ -398,7 +494,7 @@ class VideoService:
             print(
                 f"Time range: {start:.3f}s - {end:.3f}s (duration: {end - start:.3f}s)"
             )
-            print(f"Audio array length: {len(audio_array)} samples at {sr} Hz")
+            print(f"Audio frames start at: {frame_start_time:.3f}s ({sr} Hz)")
             print(f"RMS frames: {len(rms)} frames")
             print(f"{'=' * 60}")
 
@@ -452,8 +548,8 @@ class VideoService:
         end_offset = ((last_speech_frame + 1) * hop_length) / sr
 
         # Apply to original timestamps
-        adjusted_start = start + start_offset
-        adjusted_end = start + end_offset
+        adjusted_start = frame_start_time + start_offset
+        adjusted_end = frame_start_time + end_offset
 
         # Apply padding (but keep within original segment bounds)
         adjusted_start = max(start, adjusted_start - SILENCE_PADDING)
@@ -537,23 +633,12 @@ class VideoService:
         print_progress(f"Processing {len(kept_sentences)} kept sentences...")
 
         try:
-            # Load video once (still needed for creating the edited video later)
-            video = VideoFileClip(str(input_path))
-
-            # Process each kept sentence
-            adjusted_sentence_list = []
-
-            for idx, sentence in enumerate(kept_sentences, 1):
-                # Detect speech boundaries in this sentence's time range
-                adjusted_sentence = self._get_adjusted_sentence(
-                    audio_path, sentence, sentence_index=idx
-                )
-
-                # Create adjusted sentence record
-                adjusted_sentence_list.append(adjusted_sentence)
-
-            # Clean up video
-            video.close()
+            # Each sentence is a slice of one cached RMS envelope, so this loop is
+            # cheap; the video itself is not opened here
+            adjusted_sentence_list = [
+                self._get_adjusted_sentence(audio_path, sentence, sentence_index=idx)
+                for idx, sentence in enumerate(kept_sentences, 1)
+            ]
 
             print_progress(
                 f"Generated adjusted timestamps for {len(adjusted_sentence_list)} sentences"
@@ -566,12 +651,62 @@ class VideoService:
                 f"Failed to generate adjusted sentences: {str(e)}"
             ) from e
 
+    @staticmethod
+    def _edited_video_render_hash(
+        input_path: Path, adjusted_sentences: AdjustedSentences
+    ) -> str:
+        """
+        Hash everything that determines the edited video's content.
+
+        Args:
+            input_path: Video the edit is cut from
+            adjusted_sentences: AdjustedSentences with silence-trimmed timestamps
+
+        Returns:
+            Render hash for the edited video
+        """
+        return compute_render_hash(
+            [input_path],
+            adjusted_sentences.model_dump_json(),
+            *(f"{key}={value}" for key, value in EDITED_VIDEO_WRITE_OPTIONS.items()),
+        )
+
+    def edited_video_is_current(
+        self,
+        base_name: str,
+        adjusted_sentences: AdjustedSentences,
+        use_downsampled: bool = True,
+    ) -> bool:
+        """
+        Check whether the edited video was rendered from these sentences.
+
+        Args:
+            base_name: Base filename without extension
+            adjusted_sentences: AdjustedSentences with silence-trimmed timestamps
+            use_downsampled: If True, check the downsampled edit (default)
+
+        Returns:
+            True if the edited video exists and matches its last render hash
+        """
+        if use_downsampled:
+            input_path = get_downsampled_video_path(base_name)
+        else:
+            input_path = get_input_video_path(base_name)
+        if not input_path.exists():
+            return False
+
+        output_path = get_edited_video_path(base_name, use_downsampled)
+        return render_is_current(
+            output_path, self._edited_video_render_hash(input_path, adjusted_sentences)
+        )
+
     def create_edited_video(
         self,
         base_name: str,
         adjusted_sentences: AdjustedSentences,
         use_downsampled: bool = True,
         force: bool = False,
+        skip_if_current: bool = False,
     ) -> Path:
         """
         Create an edited video using pre-computed adjusted sentences.
@@ -581,6 +716,8 @@ class VideoService:
             adjusted_sentences: AdjustedSentences with silence-trimmed timestamps
             use_downsampled: If True, edit the downsampled video (default)
             force: If True, regenerate even if file exists
+            skip_if_current: If True, reuse an existing file only when it was
+                rendered from the current sentences, and re-render it otherwise
 
         Returns:
             Path to edited video file
@@ -598,17 +735,26 @@ class VideoService:
         output_path = get_edited_video_path(base_name, use_downsampled)
 
         # Skip if exists and not forcing
-        if output_path.exists() and not force:
+        if output_path.exists() and not force and not skip_if_current:
             print_progress(f"Edited video already exists: {output_path}")
             return output_path
 
         validate_file_exists(input_path)
 
-        print_progress(f"Creating edited video from {input_path.name}...")
-
         if not adjusted_sentences.sentences:
             raise ValueError("No sentences provided - cannot create video")
 
+        render_hash = self._edited_video_render_hash(input_path, adjusted_sentences)
+        if (
+            skip_if_current
+            and not force
+            and render_is_current(output_path, render_hash)
+        ):
+            print_progress("Sentences unchanged since the last render, skipping")
+            return output_path
+
+        print_progress(f"Creating edited video from {input_path.name}...")
+
         print_progress(f"Using {len(adjusted_sentences.sentences)} adjusted sentences")
 
         try:
@@ -632,10 +778,7 @@ class VideoService:
             # Write output
             print_progress(f"Writing edited video to {output_path.name}...")
             final_video.write_videofile(
-                str(output_path),
-                codec="libx264",
-                audio_codec="aac",
-                logger=None,
+                str(output_path), logger=None, **EDITED_VIDEO_WRITE_OPTIONS
             )
 
             # Clean up
@@ -644,6 +787,7 @@ class VideoService:
             for clip in clips:
                 clip.close()
 
+            record_render_hash(output_path, render_hash)
             print_progress(f"Edited video created: {output_path}")
             return output_path
 
@@ -1,13 +1,36 @@
 """
-Pure utility functions with no side effects.
-Helper functions for file operations and path management.
+Shared helper functions for the pipeline and services.
+Covers asset path management, file and render-hash bookkeeping, environment
+loading, subprocess runners and thread-safe progress output.
 """
 
+import hashlib
+import os
+import re
 import subprocess
+import sys
+import threading
+from collections import deque
+from functools import cache
 from pathlib import Path
 
+from dotenv import load_dotenv
+from pydantic_core import to_json
+
+from src.models import (
+    EditingResult,
+    ImagesMetadataFile,
+    LLMTranscriptSentence,
+    SentenceResult,
+    WordTimestamp,
+)
+
 from src.constants import (
+    APPROVAL_PHRASES,
     ASSETS_DIR,
+    ENV_FILE,
+    LOG_COMMANDS,
+    INPUT_VIDEO_EXTENSIONS,
     STAGE_1_DOWNSAMPLED_NAME,
     STAGE_2_AUDIO_NAME,
     STAGE_3_TRANSCRIPTION_NAME,
@@ -31,6 +54,19 @@ from src.constants import (
 )
 
 
+@cache
+def ensure_env_loaded() -> None:
+    """
+    Load environment variables from .env files, once per process.
+
+    Tries the project .env file first, then falls back to the current working
+    directory. Called lazily by services that need API credentials so that
+    importing the package does no .env disk I/O.
+    """
+    load_dotenv(dotenv_path=ENV_FILE, verbose=False)
+    load_dotenv(verbose=False)  # Also check CWD
+
+
 def extract_filename_without_extension(filepath: str | Path) -> str:
     """
     Extract filename without extension from a file path.
@@ -59,15 +95,11 @@ def prepare_transcript_for_prompt(
     Returns:
         List of LLMTranscriptSentence objects with sentence text and timing info
     """
-    from src.models import LLMTranscriptSentence
-
     # If transcript already has sentences, return them
     if transcript.sentences:
         return transcript.sentences
 
     # Otherwise, generate sentences from segments
-    from src.models import WordTimestamp
-
     sentences: list[LLMTranscriptSentence] = []
     current_words: list[str] = []
     current_word_timestamps: list[WordTimestamp] = []
@@ -127,6 +159,35 @@ def prepare_transcript_for_prompt(
     return sentences
 
 
+def normalize_feedback(feedback: str) -> str:
+    """
+    Normalize free-text feedback so trivially different phrasings compare equal.
+
+    Lowercases, drops punctuation and collapses whitespace, so "Looks good!"
+    and "looks  good" normalize to the same text.
+
+    Args:
+        feedback: Feedback as typed by the user
+
+    Returns:
+        Normalized feedback text
+    """
+    return " ".join(re.sub(r"[^\w\s]", " ", feedback.lower()).split())
+
+
+def is_approval_feedback(feedback: str) -> bool:
+    """
+    Check whether feedback is a plain approval that needs no interpretation.
+
+    Args:
+        feedback: Feedback as typed by the user
+
+    Returns:
+        True if the normalized feedback is one of APPROVAL_PHRASES
+    """
+    return normalize_feedback(feedback) in APPROVAL_PHRASES
+
+
 def _build_asset_path(base_filename: str, stage_name: str, extension: str) -> Path:
     """
     Build a path for a derived asset in folder structure (internal use only).
@@ -221,15 +282,82 @@ def run_command(
         ) from e
 
 
+def run_streaming_command(cmd: list[str], tail_lines: int = 200) -> None:
+    """
+    Run a long-running command, keeping only the end of its stderr.
+
+    Unlike subprocess.run(capture_output=True), stderr is read as it is
+    produced and only the last tail_lines lines are kept, so memory stays
+    bounded for tools like melt that log progress for the whole render.
+
+    Args:
+        cmd: Command and arguments as a list
+        tail_lines: Number of trailing stderr lines kept for error reporting
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits non-zero (stderr
+            holds the kept lines)
+    """
+    tail: deque[str] = deque(maxlen=tail_lines)
+    with subprocess.Popen(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    ) as process:
+        # Universal newlines also split melt's carriage-return progress updates
+        for line in process.stderr:
+            tail.append(line)
+        returncode = process.wait()
+
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr="".join(tail))
+
+
+# Serializes progress output from pipeline steps running on worker threads
+_PRINT_LOCK = threading.Lock()
+
+
 def print_progress(message: str, prefix: str = "=>") -> None:
     """
     Print a progress message to terminal.
 
+    Safe to call from concurrently running pipeline steps; each message is
+    written as one unbroken line.
+
     Args:
         message: Message to print
         prefix: Prefix for the message
     """
-    print(f"{prefix} {message}")
+    with _PRINT_LOCK:
+        print(f"{prefix} {message}")
+
+
+def print_command(cmd: list[str]) -> None:
+    """
+    Print an external command line, if LOG_COMMANDS is enabled.
+
+    Args:
+        cmd: Command and arguments as a list
+    """
+    if LOG_COMMANDS:
+        print_progress(f"Command: {' '.join(cmd)}")
+
+
+def print_progress_lines(messages: list[str], prefix: str = "=>") -> None:
+    """
+    Print several progress messages with a single write.
+
+    Use instead of calling print_progress in a loop, e.g. for per-item
+    summaries; the lines also stay together when steps run concurrently.
+
+    Args:
+        messages: Messages to print, one per line
+        prefix: Prefix for each message
+    """
+    if not messages:
+        return
+    text = "".join(f"{prefix} {message}\n" for message in messages)
+    with _PRINT_LOCK:
+        sys.stdout.write(text)
+        sys.stdout.flush()
 
 
 def ensure_directory_exists(directory: Path | str) -> None:
@@ -257,7 +385,7 @@ def get_input_video_path(base_name: str) -> Path:
     """
     folder = ASSETS_DIR / base_name
     # Try common video extensions (prioritize .mp4 for rotated/processed videos)
-    for ext in [".mp4", ".MP4", ".MOV", ".mov"]:
+    for ext in INPUT_VIDEO_EXTENSIONS:
         path = folder / f"{base_name}{ext}"
         if path.exists():
             return path
@@ -265,6 +393,152 @@ def get_input_video_path(base_name: str) -> Path:
     return folder / f"{base_name}.mp4"
 
 
+def scan_project_folders() -> dict[str, str]:
+    """
+    List video project folders in the assets directory with a single scan.
+
+    Returns:
+        Mapping of lowercase folder name to actual folder name (e.g.
+        {'img_0901': 'IMG_0901'}), for case-insensitive lookups
+    """
+    if not ASSETS_DIR.is_dir():
+        return {}
+
+    with os.scandir(ASSETS_DIR) as entries:
+        return {
+            entry.name.lower(): entry.name
+            for entry in entries
+            if entry.is_dir() and not entry.name.startswith(".")
+        }
+
+
+def find_input_video(base_name: str) -> Path | None:
+    """
+    Find the input video in a project folder with a single directory scan.
+
+    Uses the same extension priority as get_input_video_path, but returns None
+    instead of a default path when no video is present.
+
+    Args:
+        base_name: Project folder name, which is also the video's base name
+
+    Returns:
+        Path to the input video, or None if the folder or video is missing
+    """
+    folder = ASSETS_DIR / base_name
+    try:
+        with os.scandir(folder) as entries:
+            file_names = {entry.name for entry in entries if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    for ext in INPUT_VIDEO_EXTENSIONS:
+        name = f"{base_name}{ext}"
+        if name in file_names:
+            return folder / name
+    return None
+
+
+def get_inputs_record_path(output_path: Path | str) -> Path:
+    """
+    Get path to the sidecar recording which input files produced an output.
+
+    Args:
+        output_path: Path to a generated asset
+
+    Returns:
+        Path to hidden .{output_name}.inputs.json next to the output
+    """
+    output_path = Path(output_path)
+    return output_path.with_name(f".{output_path.name}.inputs.json")
+
+
+def get_file_fingerprints(paths: list[Path]) -> dict[str, list[int] | None]:
+    """
+    Fingerprint files by modification time and size (no content read).
+
+    Args:
+        paths: Files to fingerprint
+
+    Returns:
+        Mapping of path string to [mtime_ns, size], or None for missing files
+    """
+    fingerprints: dict[str, list[int] | None] = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            fingerprints[str(path)] = None
+        else:
+            fingerprints[str(path)] = [stat.st_mtime_ns, stat.st_size]
+    return fingerprints
+
+
+def get_render_hash_path(output_path: Path | str) -> Path:
+    """
+    Get path to the sidecar holding the input hash of a rendered video.
+
+    Args:
+        output_path: Path to a rendered video
+
+    Returns:
+        Path to hidden .{output_name}.render.sha256 next to the output
+    """
+    output_path = Path(output_path)
+    return output_path.with_name(f".{output_path.name}.render.sha256")
+
+
+def compute_render_hash(input_paths: list[Path], *params: str) -> str:
+    """
+    Hash everything a render depends on.
+
+    Args:
+        input_paths: Media files read by the render (fingerprinted, not read)
+        *params: Render inputs as text, e.g. serialized sentences and the
+            encoder command
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    for path, fingerprint in get_file_fingerprints(input_paths).items():
+        digest.update(f"{path}={fingerprint}\0".encode("utf-8"))
+    for param in params:
+        digest.update(param.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def render_is_current(output_path: Path, render_hash: str) -> bool:
+    """
+    Check whether a rendered video was produced from identical inputs.
+
+    Args:
+        output_path: Path to the rendered video
+        render_hash: Hash of the inputs about to be rendered
+
+    Returns:
+        True if the video exists and its recorded hash matches
+    """
+    if not output_path.exists():
+        return False
+    try:
+        return get_render_hash_path(output_path).read_text() == render_hash
+    except FileNotFoundError:
+        return False
+
+
+def record_render_hash(output_path: Path, render_hash: str) -> None:
+    """
+    Record the input hash a video was rendered from.
+
+    Args:
+        output_path: Path to the rendered video
+        render_hash: Hash of the inputs it was rendered from
+    """
+    get_render_hash_path(output_path).write_text(render_hash)
+
+
 def get_downsampled_video_path(base_name: str) -> Path:
     """
     Get path to downsampled video file (Stage 1).
@@ -382,8 +656,6 @@ def convert_editing_decision_to_result(
     Returns:
         EditingResult with sentence_results mapping
     """
-    from src.models import EditingResult, SentenceResult
-
     sentences_to_remove = set(decision.sentences_to_remove)
     sentence_results = {}
 
@@ -469,13 +741,10 @@ def save_images_metadata(base_name: str, metadata: "ImagesMetadataFile") -> Path
     Returns:
         Path to saved metadata file
     """
-    import json
-
     metadata_path = get_images_metadata_path(base_name)
     metadata_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        json.dump(metadata.model_dump(), f, indent=2)
+    metadata_path.write_bytes(to_json(metadata, indent=2))
 
     print_progress(f"Images metadata saved: {metadata_path}")
     return metadata_path
@@ -494,18 +763,12 @@ def load_images_metadata(base_name: str) -> "ImagesMetadataFile":
     Raises:
         FileNotFoundError: If metadata file doesn't exist
     """
-    import json
-    from src.models import ImagesMetadataFile
-
     metadata_path = get_images_metadata_path(base_name)
 
     if not metadata_path.exists():
         raise FileNotFoundError(f"Images metadata not found: {metadata_path}")
 
-    with open(metadata_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    return ImagesMetadataFile(**data)
+    return ImagesMetadataFile.model_validate_json(metadata_path.read_bytes())
 
 
 def get_stage_7_mlt_xml_path(base_name: str) -> Path:
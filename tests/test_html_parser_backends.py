@@ -0,0 +1,50 @@
+"""
+Checks that both BeautifulSoup tree builders read a Google Doc export alike.
+
+GoogleDocHTMLParser uses lxml when it is installed and html.parser otherwise,
+and its output feeds the step 9 response cache key, so the two must agree.
+"""
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("lxml")
+
+from src.services.html_parser import html_parser  # noqa: E402
+
+# Trimmed from a Google Docs "Web page (.html, zipped)" export
+SAMPLE_EXPORT = (
+    "<html><head>"
+    '<meta content="text/html; charset=UTF-8" http-equiv="content-type">'
+    '<style type="text/css">.c0{padding-top:0pt}.c1{font-size:11pt}</style>'
+    "</head>"
+    '<body class="c5 doc-content">'
+    '<h1 class="c3" id="h.intro"><span class="c2">Intro</span></h1>'
+    '<p class="c0"><span class="c1">It&rsquo;s the   first line.</span></p>'
+    '<p class="c0"><span style="overflow: hidden; display: inline-block;">'
+    '<img alt="" src="images/image1.png" style="width: 624.00px;" title="">'
+    "</span></p>"
+    '<p class="c0 c4"><span class="c1"></span></p>'
+    '<p class="c0"><span class="c1">Text and </span>'
+    '<span><img src="images/image2.png"></span></p>'
+    '<p class="c0"><span class="c1">Last line</span><br></p>'
+    "</body></html>"
+)
+
+
+def _parse_with(monkeypatch, features):
+    monkeypatch.setattr(html_parser, "HTML_PARSER_FEATURES", features)
+    return html_parser.GoogleDocHTMLParser().parse_html(SAMPLE_EXPORT)
+
+
+def test_lxml_and_html_parser_agree(monkeypatch):
+    with_lxml = _parse_with(monkeypatch, "lxml")
+    with_stdlib = _parse_with(monkeypatch, "html.parser")
+
+    assert with_lxml.model_dump_json() == with_stdlib.model_dump_json()
+    assert [(line.text, line.image_filename) for line in with_lxml.lines] == [
+        ("Intro", None),
+        ("It’s the first line.", "image1.png"),
+        ("Text and", "image2.png"),
+        ("Last line", None),
+    ]
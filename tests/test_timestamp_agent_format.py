@@ -0,0 +1,117 @@
+"""
+Pins the prompt state format of the timestamp adjustment agent.
+
+The state is sent as a cached prompt prefix and hashed into response cache
+keys, so any change to its text must be deliberate.
+"""
+
+from src.models import AdjustedSentence, AdjustedSentences, WordTimestamp
+from src.services.agents import TimestampAdjustmentAgent
+from src.services.content_cache import ContentCache
+from src.services.llm.base import LLMService
+
+
+class _UnusedLLMService(LLMService):
+    """LLM service stand-in; formatting never calls the LLM."""
+
+    def complete(self, prompt, **kwargs):
+        raise AssertionError("The LLM should not be called")
+
+
+def _sentence(index, text, start, end, words):
+    return AdjustedSentence(
+        original_start=start,
+        original_end=end,
+        adjusted_start=start,
+        adjusted_end=end,
+        text=text,
+        index=index,
+        threshold_source="video",
+        words=[WordTimestamp(word=w, start=s, end=e) for w, s, e in words],
+    )
+
+
+SENTENCES = AdjustedSentences(
+    sentences=[
+        _sentence(
+            "1",
+            "Hello world.",
+            0.5,
+            1.25,
+            [("Hello", 0.5, 0.75), ("world.", 0.8, 1.25)],
+        ),
+        # 4.125 rounds half to even under .2f
+        _sentence(
+            "3",
+            "Second take.",
+            4.125,
+            5.0,
+            [("Second", 4.125, 4.5), ("take.", 4.5, 5.0)],
+        ),
+    ]
+)
+
+EXPECTED_WITH_WORDS = (
+    "Sentence 1:\n"
+    '"Hello world." [0.50 - 1.25]\n'
+    "[0.50 - 0.75] Hello\n"
+    "[0.80 - 1.25] world.\n"
+    "\n"
+    "Sentence 3:\n"
+    '"Second take." [4.12 - 5.00]\n'
+    "[4.12 - 4.50] Second\n"
+    "[4.50 - 5.00] take.\n"
+)
+
+EXPECTED_WITHOUT_WORDS = (
+    "Sentence 1:\n"
+    '"Hello world." [0.50 - 1.25]\n'
+    "\n"
+    "Sentence 3:\n"
+    '"Second take." [4.12 - 5.00]\n'
+)
+
+EXPECTED_HASH = "e34631f63fc7da55ca6ad35fcfd701494eba2dd709f02f70431d35860154c79b"
+
+
+def _agent(tmp_path):
+    return TimestampAdjustmentAgent(
+        llm_service=_UnusedLLMService(), cache=ContentCache("test", tmp_path)
+    )
+
+
+def test_format_sentence_block():
+    block = TimestampAdjustmentAgent._format_sentence(
+        SENTENCES.sentences[0], include_words=True
+    )
+    assert block == (
+        "Sentence 1:\n"
+        '"Hello world." [0.50 - 1.25]\n'
+        "[0.50 - 0.75] Hello\n"
+        "[0.80 - 1.25] world.\n"
+    )
+
+
+def test_sentences_to_json_with_words(tmp_path):
+    state = _agent(tmp_path)._sentences_to_json(SENTENCES, include_words=True)
+    assert state == EXPECTED_WITH_WORDS
+    assert ContentCache.hash_text(state) == EXPECTED_HASH
+
+
+def test_sentences_to_json_without_words(tmp_path):
+    state = _agent(tmp_path)._sentences_to_json(SENTENCES, include_words=False)
+    assert state == EXPECTED_WITHOUT_WORDS
+
+
+def test_reused_blocks_match_fresh_ones(tmp_path):
+    agent = _agent(tmp_path)
+    agent._sentences_to_json(SENTENCES, include_words=True)
+    # The second call is served from the per-sentence block cache
+    state = agent._sentences_to_json(SENTENCES, include_words=True)
+    assert state == EXPECTED_WITH_WORDS
+
+    # Moving a boundary re-renders only that sentence's block
+    moved_sentences = SENTENCES.model_copy(deep=True)
+    moved_sentences.sentences[0].adjusted_start = 0.6
+    moved = agent._sentences_to_json(moved_sentences, include_words=True)
+    assert moved == EXPECTED_WITH_WORDS.replace("[0.50 - 1.25]", "[0.60 - 1.25]")